@@ -1,36 +1,48 @@
 import logging
-from typing import List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
 
+from pydantic import TypeAdapter
 from slugify import slugify
+from supabase import Client
 
 from app.database.connection import db_connection
 from app.models import Tool, ToolCreate
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole response payload in one pydantic-core call
+_tool_list_adapter = TypeAdapter(List[Tool])
+
+# Tools sent per upsert request by bulk_insert_tools
+BULK_INSERT_BATCH_SIZE = 1000
+
+
+def _tool_record(tool: ToolCreate) -> Dict[str, Any]:
+    """Build the tools table row for a tool."""
+    return {
+        "name": tool.name,
+        "slug": tool.slug,
+        "description": tool.description,
+        "website_url": tool.website_url,
+        "logo_url": tool.logo_url,
+        "pricing_type": tool.pricing_type,
+        "price_range": tool.price_range,
+        "has_free_trial": tool.has_free_trial,
+        "tags": tool.tags,
+        "features": tool.features,
+        "quality_score": tool.quality_score,
+        "popularity_score": tool.popularity_score,
+        "is_featured": tool.is_featured,
+        "source": tool.source,
+    }
+
 
 class DatabaseService:
     def insert_tool(self, tool: ToolCreate) -> Optional[Tool]:
         client = db_connection.get_client()
         try:
-            data = {
-                "name": tool.name,
-                "slug": tool.slug,
-                "description": tool.description,
-                "website_url": tool.website_url,
-                "logo_url": tool.logo_url,
-                "pricing_type": tool.pricing_type,
-                "price_range": tool.price_range,
-                "has_free_trial": tool.has_free_trial,
-                "tags": tool.tags,
-                "features": tool.features,
-                "quality_score": tool.quality_score,
-                "popularity_score": tool.popularity_score,
-                "is_featured": tool.is_featured,
-                "source": tool.source,
-            }
-
-            response = client.table("tools").insert(data).execute()
+            response = client.table("tools").insert(_tool_record(tool)).execute()
 
             if response.data and len(response.data) > 0:
                 return Tool(**response.data[0])
@@ -39,39 +51,17 @@ class DatabaseService:
             logger.error(f"Error inserting tool: {e}")
             return None
 
-    def bulk_insert_tools(self, tools: List[ToolCreate]) -> int:
+    def bulk_insert_tools(
+        self, tools: Iterable[ToolCreate], batch_size: int = BULK_INSERT_BATCH_SIZE
+    ) -> int:
+        """Upsert tools in fixed-size batches, consuming the iterable lazily"""
         client = db_connection.get_client()
         inserted_count = 0
 
         try:
-            for tool in tools:
-                try:
-                    data = {
-                        "name": tool.name,
-                        "slug": tool.slug,
-                        "description": tool.description,
-                        "website_url": tool.website_url,
-                        "logo_url": tool.logo_url,
-                        "pricing_type": tool.pricing_type,
-                        "price_range": tool.price_range,
-                        "has_free_trial": tool.has_free_trial,
-                        "tags": tool.tags,
-                        "features": tool.features,
-                        "quality_score": tool.quality_score,
-                        "popularity_score": tool.popularity_score,
-                        "is_featured": tool.is_featured,
-                        "source": tool.source,
-                    }
-
-                    # Use upsert to handle conflicts
-                    response = client.table("tools").upsert(data, on_conflict="slug").execute()
-
-                    if response.data and len(response.data) > 0:
-                        inserted_count += 1
-
-                except Exception as e:
-                    logger.error(f"Error inserting tool {tool.name}: {e}")
-                    continue
+            iterator = iter(tools)
+            while batch := list(islice(iterator, batch_size)):
+                inserted_count += self._upsert_tool_batch(client, batch)
 
         except Exception as e:
             logger.error(f"Error in bulk insert: {e}")
@@ -79,6 +69,31 @@ class DatabaseService:
         logger.info(f"Bulk inserted {inserted_count} tools")
         return inserted_count
 
+    def _upsert_tool_batch(self, client: Client, batch: List[ToolCreate]) -> int:
+        records = [_tool_record(tool) for tool in batch]
+
+        try:
+            # Use upsert to handle conflicts
+            response = client.table("tools").upsert(records, on_conflict="slug").execute()
+            return len(response.data or [])
+        except Exception as e:
+            logger.warning(f"Batch upsert of {len(batch)} tools failed, retrying per tool: {e}")
+
+        # Retry one by one so a single bad row does not drop the whole batch
+        inserted_count = 0
+        for tool, record in zip(batch, records):
+            try:
+                response = client.table("tools").upsert(record, on_conflict="slug").execute()
+
+                if response.data and len(response.data) > 0:
+                    inserted_count += 1
+
+            except Exception as e:
+                logger.error("Error inserting tool %s: %s", tool.name, e)
+                continue
+
+        return inserted_count
+
     def get_tools_by_tags(self, tags: List[str], limit: int = 50, offset: int = 0) -> List[Tool]:
         """Get tools that contain any of the specified tags"""
         client = db_connection.get_client()
@@ -97,7 +112,7 @@ class DatabaseService:
             )
 
             if response.data:
-                return [Tool(**item) for item in response.data]
+                return _tool_list_adapter.validate_python(response.data)
             return []
         except Exception as e:
             logger.error(f"Error getting tools by tags: {e}")
@@ -118,7 +133,7 @@ class DatabaseService:
             )
 
             if response.data:
-                return [Tool(**item) for item in response.data]
+                return _tool_list_adapter.validate_python(response.data)
             return []
         except Exception as e:
             logger.error(f"Error getting all tools: {e}")
@@ -139,7 +154,7 @@ class DatabaseService:
             )
 
             if response.data:
-                return [Tool(**item) for item in response.data]
+                return _tool_list_adapter.validate_python(response.data)
             return []
         except Exception as e:
             logger.error(f"Error getting featured tools: {e}")
@@ -174,21 +189,23 @@ class DatabaseService:
             )
 
             # Combine and deduplicate results
-            tools = []
+            items = []
             seen_ids = set()
 
             if name_response.data:
                 for item in name_response.data:
                     if item["id"] not in seen_ids:
-                        tools.append(Tool(**item))
+                        items.append(item)
                         seen_ids.add(item["id"])
 
             if desc_response.data:
                 for item in desc_response.data:
                     if item["id"] not in seen_ids:
-                        tools.append(Tool(**item))
+                        items.append(item)
                         seen_ids.add(item["id"])
 
+            tools = _tool_list_adapter.validate_python(items)
+
             # Sort by popularity and quality score
             tools.sort(key=lambda x: (-x.popularity_score, -x.quality_score))
             return tools[:limit]
@@ -208,7 +225,7 @@ class DatabaseService:
                 for row in response.data:
                     if row.get("tags"):
                         all_tags.update(row["tags"])
-                return sorted(list(all_tags))
+                return sorted(all_tags)
             return []
         except Exception as e:
             logger.error(f"Error getting all tags: {e}")
@@ -1,4 +1,8 @@
+import asyncio
+import codecs
+import io
 import logging
+from typing import BinaryIO
 
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 
@@ -8,6 +12,40 @@ from app.services.csv_importer_factory import CSVImporterFactory
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Bytes read from the upload per chunk while checking its encoding
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Largest accepted CSV upload
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+
+
+def _size_limit_error() -> HTTPException:
+    """Build the error for uploads over MAX_UPLOAD_BYTES."""
+    # Whole megabytes read best, but other limits must not round down (to 0MB)
+    if MAX_UPLOAD_BYTES % (1024 * 1024) == 0:
+        limit = f"{MAX_UPLOAD_BYTES // (1024 * 1024)}MB"
+    else:
+        limit = f"{MAX_UPLOAD_BYTES} bytes"
+    return HTTPException(status_code=400, detail=f"File size must be less than {limit}")
+
+
+def _check_upload(raw: BinaryIO) -> int:
+    """
+    Check an upload is UTF-8 and within the size limit, returning its size.
+
+    Reads chunk by chunk, so neither the raw bytes nor the decoded text of the
+    whole file are held in memory at once, then rewinds the file.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    file_size = 0
+    while chunk := raw.read(UPLOAD_CHUNK_SIZE):
+        file_size += len(chunk)
+        if file_size > MAX_UPLOAD_BYTES:
+            raise _size_limit_error()
+        decoder.decode(chunk)
+    decoder.decode(b"", final=True)
+    raw.seek(0)
+    return file_size
+
 
 @router.get("/stats")
 async def get_stats() -> dict[str, str]:
@@ -48,27 +86,34 @@ async def import_tools_from_csv(
     if not file.filename or not file.filename.endswith(".csv"):
         raise HTTPException(status_code=400, detail="File must be a CSV file")
 
-    # Check file size (limit to 100MB)
-    if file.size and file.size > 100 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="File size must be less than 100MB")
+    # Check file size (limit to 100MB); uploads without a declared size are
+    # also checked while they are streamed below
+    if file.size and file.size > MAX_UPLOAD_BYTES:
+        raise _size_limit_error()
 
     try:
-        # Read file content
-        content = await file.read()
-        csv_content = content.decode("utf-8")
+        # One worker-thread hop for the whole pass instead of one per chunk read
+        # once the spooled upload has rolled over to disk
+        file_size = await asyncio.to_thread(_check_upload, file.file)
 
-        logger.info(
-            f"Processing {source} CSV file: {file.filename} ({len(csv_content)} characters)"
-        )
+        logger.info(f"Processing {source} CSV file: {file.filename} ({file_size} bytes)")
 
         # Get appropriate importer for the source
         importer = CSVImporterFactory.get_importer(source)
-        results = await importer.import_from_csv_content(csv_content, replace_existing)
+
+        # The importer parses the spooled upload lazily through a text stream
+        csv_file = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+        try:
+            results = await importer.import_from_csv_content(csv_file, replace_existing)
+        finally:
+            csv_file.detach()  # leave closing the upload to FastAPI
 
         logger.info(f"{source} CSV import completed: {results}")
 
         return CSVImportResponse(**results)
 
+    except HTTPException:
+        raise
     except UnicodeDecodeError:
         raise HTTPException(status_code=400, detail="File must be UTF-8 encoded")
     except ValueError as e:
@@ -1,9 +1,26 @@
+import csv
 import logging
 import re
 import urllib.parse
-from typing import Any, Dict, List, Optional
-
-import pandas as pd
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+# Pricing markers found in the "ai_launch_date" column and the type each implies
+_PRICING_MARKERS = {
+    "100% free": "free",
+    "free +": "freemium",
+    "free trial": "freemium",
+    "from $": "paid",
+    "/mo": "paid",
+    "one-time": "one-time",
+    "buy once": "one-time",
+}
+# When several markers match, the earliest type in this order wins
+_PRICING_PRECEDENCE = ("free", "freemium", "paid", "one-time")
+_PRICING_RE = re.compile("|".join(re.escape(marker) for marker in _PRICING_MARKERS))
+
+# Slug patterns: drop special characters, then collapse whitespace/hyphen runs
+_SLUG_STRIP = re.compile(r"[^a-z0-9\s-]")
+_SLUG_SEPARATORS = re.compile(r"[\s-]+")
 
 
 class TAaftParser:
@@ -23,23 +40,7 @@ class TAaftParser:
             List[Dict]: List of tool dictionaries ready for database insertion
         """
         try:
-            # Read CSV with pandas
-            df = pd.read_csv(file_path)
-
-            # Clean column names (remove extra spaces)
-            df.columns = df.columns.str.strip()
-
-            self.logger.info(f"Loaded CSV with {len(df)} rows and {len(df.columns)} columns")
-
-            # Filter out rows without tool names
-            df = df[df["ai_link"].notna() & (df["ai_link"].str.strip() != "")]
-
-            tools = []
-            for _, row in df.iterrows():
-                tool = self.transform_row(row)
-                if tool:
-                    tools.append(tool)
-
+            tools = list(self.iter_tools(file_path))
             self.logger.info(f"Successfully parsed {len(tools)} tools from CSV")
             return tools
 
@@ -47,12 +48,39 @@ class TAaftParser:
             self.logger.error(f"Error parsing CSV: {e}")
             raise
 
-    def transform_row(self, row: pd.Series) -> Optional[Dict[str, Any]]:
+    def iter_tools(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily parse a CSV file one row at a time
+
+        Args:
+            file_path (str): Path to the CSV file
+
+        Yields:
+            Dict: Database-ready tool dictionaries
+        """
+        with open(file_path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+
+            # Clean column names (remove extra spaces)
+            if reader.fieldnames:
+                reader.fieldnames = [name.strip() for name in reader.fieldnames]
+                self.logger.info(f"Loaded CSV with {len(reader.fieldnames)} columns")
+
+            for row in reader:
+                # Skip rows without tool names
+                if not self.clean_string(row.get("ai_link")):
+                    continue
+
+                tool = self.transform_row(row)
+                if tool:
+                    yield tool
+
+    def transform_row(self, row: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Transform a CSV row into a database tool object
 
         Args:
-            row (pd.Series): CSV row
+            row (Mapping): CSV row
 
         Returns:
             Dict or None: Database-ready tool object or None if invalid
@@ -66,8 +94,11 @@ class TAaftParser:
                 "name": name,
                 "slug": self.generate_slug(name),
                 "description": self.extract_description(row),
+                # Blank cells read as "", so an empty external link falls back
+                # to the visit-website link, and neither link gives None
                 "website_url": self.clean_url(
-                    row.get("external_ai_link href") or row.get("visit_ai_website_link href")
+                    self.clean_string(row.get("external_ai_link href"))
+                    or self.clean_string(row.get("visit_ai_website_link href"))
                 ),
                 "logo_url": self.clean_string(row.get("taaft_icon src")),
                 "pricing_type": self.extract_pricing_type(row.get("ai_launch_date")),
@@ -82,28 +113,27 @@ class TAaftParser:
                 "source": self.source,
             }
         except Exception as e:
-            self.logger.warning(f"Error transforming row for {row.get('ai_link', 'unknown')}: {e}")
+            self.logger.warning(
+                "Error transforming row for %s: %s", row.get("ai_link", "unknown"), e
+            )
             return None
 
     def clean_string(self, value: Any) -> Optional[str]:
         """Clean and normalize string values"""
-        if pd.isna(value) or not isinstance(value, str):
+        if not isinstance(value, str):
             return None
         cleaned = str(value).strip()
         return cleaned if cleaned else None
 
     def generate_slug(self, name: str) -> str:
         """Generate URL-friendly slug from name"""
-        slug = name.lower()
-        slug = re.sub(r"[^a-z0-9\s-]", "", slug)  # Remove special characters
-        slug = re.sub(r"\s+", "-", slug)  # Replace spaces with hyphens
-        slug = re.sub(r"--+", "-", slug)  # Replace multiple hyphens
-        slug = slug.strip("-")  # Remove leading/trailing hyphens
-        return slug
+        slug = _SLUG_STRIP.sub("", name.lower())  # Remove special characters
+        slug = _SLUG_SEPARATORS.sub("-", slug)  # Spaces and repeated hyphens -> one hyphen
+        return slug.strip("-")  # Remove leading/trailing hyphens
 
     def clean_url(self, url: Any) -> Optional[str]:
         """Clean URL by removing tracking parameters"""
-        if pd.isna(url) or not isinstance(url, str):
+        if not isinstance(url, str):
             return None
 
         try:
@@ -129,10 +159,10 @@ class TAaftParser:
 
             return urllib.parse.urlunparse(clean_parsed)
         except Exception:
-            self.logger.warning(f"Invalid URL: {url}")
+            self.logger.warning("Invalid URL: %s", url)
             return None
 
-    def extract_description(self, row: pd.Series) -> Optional[str]:
+    def extract_description(self, row: Mapping[str, Any]) -> Optional[str]:
         """Extract description from available fields"""
         task_label = self.clean_string(row.get("task_label"))
         comment_body = self.clean_string(row.get("comment_body"))
@@ -145,25 +175,20 @@ class TAaftParser:
 
     def extract_pricing_type(self, pricing_str: Any) -> str:
         """Extract pricing type from pricing string"""
-        if pd.isna(pricing_str) or not isinstance(pricing_str, str):
+        if not isinstance(pricing_str, str):
             return "no-pricing"
 
         pricing = pricing_str.lower()
-
-        if "100% free" in pricing or pricing == "free":
+        if pricing == "free":
             return "free"
-        elif "free +" in pricing or "free trial" in pricing:
-            return "freemium"
-        elif "from $" in pricing or "/mo" in pricing:
-            return "paid"
-        elif "one-time" in pricing or "buy once" in pricing:
-            return "one-time"
 
-        return "no-pricing"
+        # One regex pass collects every marker instead of a substring scan per marker
+        found = {_PRICING_MARKERS[marker] for marker in _PRICING_RE.findall(pricing)}
+        return next((ptype for ptype in _PRICING_PRECEDENCE if ptype in found), "no-pricing")
 
     def extract_price_range(self, pricing_str: Any) -> Optional[str]:
         """Extract price range from pricing string"""
-        if pd.isna(pricing_str) or not isinstance(pricing_str, str):
+        if not isinstance(pricing_str, str):
             return None
 
         # Clean up pricing string for display
@@ -173,13 +198,13 @@ class TAaftParser:
 
     def extract_has_free_trial(self, pricing_str: Any) -> bool:
         """Check if tool has free trial"""
-        if pd.isna(pricing_str) or not isinstance(pricing_str, str):
+        if not isinstance(pricing_str, str):
             return False
 
         pricing = pricing_str.lower()
         return "free" in pricing or "trial" in pricing
 
-    def extract_tags(self, row: pd.Series) -> Optional[List[str]]:
+    def extract_tags(self, row: Mapping[str, Any]) -> Optional[List[str]]:
         """Extract tags from task label"""
         tags = []
 
@@ -196,18 +221,17 @@ class TAaftParser:
 
         return tags if tags else None
 
-    def extract_features(self, row: pd.Series) -> Optional[List[str]]:
+    def extract_features(self, row: Mapping[str, Any]) -> Optional[List[str]]:
         """Extract features based on available data"""
         features = []
 
         # Add features based on rating
-        if not pd.isna(row.get("average_rating")):
-            try:
-                rating = float(row["average_rating"])
-                if rating >= 4.5:
-                    features.append("highly-rated")
-            except (ValueError, TypeError):
-                pass
+        try:
+            rating = float(row.get("average_rating"))
+            if rating >= 4.5:
+                features.append("highly-rated")
+        except (ValueError, TypeError):
+            pass
 
         # Add feature if has user reviews
         if self.clean_string(row.get("comment_body")):
@@ -215,22 +239,21 @@ class TAaftParser:
 
         return features if features else None
 
-    def calculate_quality_score(self, row: pd.Series) -> int:
+    def calculate_quality_score(self, row: Mapping[str, Any]) -> int:
         """Calculate quality score based on available metrics"""
         score = 5.0  # Base score
 
         # Boost based on rating
-        if not pd.isna(row.get("average_rating")):
-            try:
-                rating = float(row["average_rating"])
-                if rating >= 4.5:
-                    score += 2
-                elif rating >= 4.0:
-                    score += 1
-                elif rating < 3.0:
-                    score -= 1
-            except (ValueError, TypeError):
-                pass
+        try:
+            rating = float(row.get("average_rating"))
+            if rating >= 4.5:
+                score += 2
+            elif rating >= 4.0:
+                score += 1
+            elif rating < 3.0:
+                score -= 1
+        except (ValueError, TypeError):
+            pass
 
         # Boost if has user comments
         if self.clean_string(row.get("comment_body")):
@@ -248,7 +271,7 @@ class TAaftParser:
 
         return max(1, min(10, round(score)))
 
-    def calculate_popularity_score(self, row: pd.Series) -> int:
+    def calculate_popularity_score(self, row: Mapping[str, Any]) -> int:
         """Calculate popularity score based on views and saves"""
         score = 0
 
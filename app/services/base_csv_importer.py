@@ -1,17 +1,35 @@
 """Base CSV importer service for bulk tool insertion."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from dataclasses import asdict
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
 
 from app.database.connection import db_connection
+from app.services.base_csv_parser import CSVContent, ParsedTool
 
 logger = logging.getLogger(__name__)
 
+ToolRecord = Union[ParsedTool, Dict[str, Any]]
+
+
+def _to_record(tool: ToolRecord) -> Dict[str, Any]:
+    """Serialize a parsed tool into the dict payload sent to Supabase."""
+    return asdict(tool) if isinstance(tool, ParsedTool) else tool
+
 
 class BaseCSVImporter(ABC):
     """Base class for CSV importers from different sources."""
 
+    # Maximum tools sent per upsert request; importers may override
+    BULK_BATCH_SIZE = 500
+    # Sub-batches uploaded at the same time
+    MAX_CONCURRENT_BATCHES = 5
+    # Parsed chunks allowed to wait for insertion while parsing continues
+    MAX_QUEUED_CHUNKS = 2
+
     def __init__(self) -> None:
         self.client = db_connection.get_client()
 
@@ -27,29 +45,93 @@ class BaseCSVImporter(ABC):
         pass
 
     async def import_from_csv_content(
-        self, csv_content: str, replace_existing: bool = False
+        self, csv_content: CSVContent, replace_existing: bool = False
     ) -> Dict[str, Any]:
         """
         Import tools from CSV content.
 
         Args:
-            csv_content (str): CSV content as string
+            csv_content (CSVContent): CSV content as a string, or a seekable text
+                stream that is parsed lazily without loading the whole file
             replace_existing (bool): Whether to replace existing tools with same slug
 
         Returns:
             Dict: Import results with counts and details
         """
+        # Counts live outside the try block: chunks are written as they are
+        # parsed, so a failure partway through must still report them
+        total_parsed = 0
+        results = {"imported": 0, "skipped": 0, "errors": 0}
+        # Slugs stored by earlier chunks of this import. Scoped to the call, so
+        # tools deleted from the database between imports are inserted again.
+        known_slugs: Set[str] = set()
+
         try:
             # Get source-specific parser and validate format
             parser = self.get_parser()
 
             # Validate CSV format before parsing
             parser.validate_csv_format(csv_content)
+            if not isinstance(csv_content, str):
+                csv_content.seek(0)  # validation consumed the header row
+
+            # Parsed tools are pulled in chunks and inserted as they arrive, so
+            # the full tool list is never held in memory at once. Each chunk is
+            # large enough to fill every concurrent sub-batch upload. Parsing is
+            # CPU-bound, so it runs in worker threads to keep the event loop free
+            # for other requests.
+            tools = iter(await asyncio.to_thread(parser.parse_csv_content, csv_content))
+            chunk_size = self.BULK_BATCH_SIZE * self.MAX_CONCURRENT_BATCHES
+
+            # A producer task keeps parsing the next chunks while the current one
+            # is being uploaded; the bounded queue stops it from running ahead.
+            queue: asyncio.Queue[Optional[List[ToolRecord]]] = asyncio.Queue(
+                maxsize=self.MAX_QUEUED_CHUNKS
+            )
 
-            # Parse CSV content
-            tools = parser.parse_csv_content(csv_content)
+            # Cancelling an awaited to_thread call does not stop its worker
+            # thread, so the producer is asked to stop between chunks instead
+            stop_parsing = asyncio.Event()
 
-            if not tools:
+            def next_chunk() -> List[ToolRecord]:
+                return list(islice(tools, chunk_size))
+
+            async def produce() -> None:
+                try:
+                    while not stop_parsing.is_set() and (
+                        chunk := await asyncio.to_thread(next_chunk)
+                    ):
+                        await queue.put(chunk)
+                except Exception:
+                    # Let the consumer finish; the error surfaces via the task
+                    await queue.put(None)
+                    raise
+                await queue.put(None)
+
+            producer = asyncio.create_task(produce())
+            try:
+                while (chunk := await queue.get()) is not None:
+                    total_parsed += len(chunk)
+                    chunk_results = await self.bulk_insert_tools(
+                        chunk, replace_existing, known_slugs
+                    )
+                    for key, count in chunk_results.items():
+                        results[key] += count
+            except BaseException:
+                # Stop parsing and drain the queue until the producer signs off.
+                # This waits for the chunk being parsed in its worker thread, so
+                # the thread is done reading csv_content before the caller closes
+                # or detaches the stream.
+                stop_parsing.set()
+                while await queue.get() is not None:
+                    pass
+                await asyncio.gather(producer, return_exceptions=True)
+                raise
+            # A parser error re-raises here, after the consumer has counted
+            # every chunk parsed before it
+            await producer
+
+            if not total_parsed:
                 return {
                     "success": False,
                     "message": f"No valid tools found in {self.source_name} CSV",
@@ -58,19 +140,29 @@ class BaseCSVImporter(ABC):
                     "errors": 0,
                 }
 
-            # Import tools to database
-            results = await self.bulk_insert_tools(tools, replace_existing)
-
             return {
                 "success": True,
-                "message": f"Successfully processed {len(tools)} tools from {self.source_name}",
-                "total_parsed": len(tools),
+                "message": f"Successfully processed {total_parsed} tools from {self.source_name}",
+                "total_parsed": total_parsed,
                 "source": self.source_name,
                 **results,
             }
 
         except Exception as e:
             logger.error(f"Error importing {self.source_name} CSV: {e}")
+            if total_parsed:
+                # Earlier chunks are already in the database; report what they did
+                return {
+                    "success": False,
+                    "message": (
+                        f"Import partially completed for {self.source_name}: "
+                        f"processed {total_parsed} tools before failing: {str(e)}"
+                    ),
+                    "total_parsed": total_parsed,
+                    "source": self.source_name,
+                    **results,
+                    "errors": results["errors"] + 1,
+                }
             return {
                 "success": False,
                 "message": f"Import failed for {self.source_name}: {str(e)}",
@@ -81,14 +173,20 @@ class BaseCSVImporter(ABC):
             }
 
     async def bulk_insert_tools(
-        self, tools: List[Dict[str, Any]], replace_existing: bool = False
+        self,
+        tools: Sequence[ToolRecord],
+        replace_existing: bool = False,
+        known_slugs: Optional[Set[str]] = None,
     ) -> Dict[str, int]:
         """
         Bulk insert tools into database using efficient upsert.
 
         Args:
-            tools (List[Dict]): List of tool dictionaries
+            tools (Sequence): Parsed tools or tool dictionaries
             replace_existing (bool): Whether to replace existing tools
+            known_slugs (Set[str], optional): Slugs already stored earlier in the
+                same import; skipped without a database call when not replacing,
+                and extended with the slugs of every successful sub-batch
 
         Returns:
             Dict: Results with counts
@@ -97,42 +195,70 @@ class BaseCSVImporter(ABC):
             return {"imported": 0, "skipped": 0, "errors": 0}
 
         try:
-            if replace_existing:
-                # Use upsert to insert or update all tools in one request
-                response = self.client.table("tools").upsert(tools, on_conflict="slug").execute()
-                imported = len(response.data) if response.data else 0
-                logger.info(f"Bulk upserted {imported} tools from {self.source_name}")
-                return {"imported": imported, "skipped": 0, "errors": 0}
-            else:
-                # Get existing slugs in one query to check for conflicts
-                existing_slugs = set()
-                slugs = [tool["slug"] for tool in tools]
-
-                if slugs:
-                    response = (
-                        self.client.table("tools").select("slug").in_("slug", slugs).execute()
-                    )
-                    if response.data:
-                        existing_slugs = {row["slug"] for row in response.data}
-
-                # Split tools into new and existing
-                new_tools = [tool for tool in tools if tool["slug"] not in existing_slugs]
-                skipped_count = len(tools) - len(new_tools)
-
-                if new_tools:
-                    # Insert only new tools in one bulk operation
-                    response = self.client.table("tools").insert(new_tools).execute()
-                    imported = len(response.data) if response.data else 0
-                    logger.info(
-                        f"Bulk inserted {imported} new tools from {self.source_name}, "
-                        f"skipped {skipped_count} existing"
-                    )
-                else:
-                    imported = 0
-                    logger.info(f"All {skipped_count} tools from {self.source_name} already exist")
+            # Records are only materialized as dicts at the database boundary.
+            # Repeated slugs within one CSV keep their first row, since a single
+            # upsert statement cannot touch the same slug twice. Without
+            # replace_existing, slugs an earlier chunk already stored are
+            # skipped locally instead of being sent again.
+            skip_slugs = known_slugs if known_slugs is not None and not replace_existing else set()
+            records: List[Dict[str, Any]] = []
+            seen_slugs: Set[str] = set()
+            for record in map(_to_record, tools):
+                slug = record["slug"]
+                if slug not in seen_slugs and slug not in skip_slugs:
+                    seen_slugs.add(slug)
+                    records.append(record)
+        except Exception as e:
+            logger.error(f"Error in bulk insert for {self.source_name}: {e}")
+            return {"imported": 0, "skipped": 0, "errors": len(tools)}
+
+        # Fixed-size sub-batches keep each request body bounded for large CSVs.
+        # The Supabase client is synchronous, so each upload runs in a worker
+        # thread and a semaphore caps how many requests are in flight.
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
 
-                return {"imported": imported, "skipped": skipped_count, "errors": 0}
+        async def upload(batch: List[Dict[str, Any]]) -> Dict[str, int]:
+            async with semaphore:
+                return await asyncio.to_thread(self._upsert_batch, batch, replace_existing)
 
+        batches = [
+            records[start : start + self.BULK_BATCH_SIZE]
+            for start in range(0, len(records), self.BULK_BATCH_SIZE)
+        ]
+        batch_results = await asyncio.gather(*(upload(batch) for batch in batches))
+
+        if known_slugs is not None:
+            # Every slug in a successful batch now exists, inserted or not
+            for batch, batch_result in zip(batches, batch_results):
+                if not batch_result["errors"]:
+                    known_slugs.update(record["slug"] for record in batch)
+
+        results = {"imported": 0, "skipped": len(tools) - len(records), "errors": 0}
+        for batch_result in batch_results:
+            for key, count in batch_result.items():
+                results[key] += count
+
+        logger.info(
+            f"Bulk {'upserted' if replace_existing else 'inserted'} {results['imported']} tools "
+            f"from {self.source_name}, skipped {results['skipped']}, errors {results['errors']}"
+        )
+        return results
+
+    def _upsert_batch(self, batch: List[Dict[str, Any]], replace_existing: bool) -> Dict[str, int]:
+        """Send one sub-batch and count what the database accepted."""
+        try:
+            # One round trip either way: existing slugs are updated when replacing,
+            # otherwise the database skips them (ON CONFLICT DO NOTHING) and only
+            # returns the rows it actually inserted
+            response = (
+                self.client.table("tools")
+                .upsert(batch, on_conflict="slug", ignore_duplicates=not replace_existing)
+                .execute()
+            )
         except Exception as e:
             logger.error(f"Error in bulk insert for {self.source_name}: {e}")
-            return {"imported": 0, "skipped": 0, "errors": len(tools)}
+            return {"imported": 0, "skipped": 0, "errors": len(batch)}
+
+        imported = len(response.data) if response.data else 0
+        skipped = 0 if replace_existing else len(batch) - imported
+        return {"imported": imported, "skipped": skipped, "errors": 0}
@@ -1,12 +1,46 @@
 """Base CSV parser interface for different data sources."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from dataclasses import dataclass, fields
+from io import StringIO
+from typing import FrozenSet, Iterable, List, Optional, TextIO, Union
+
+# CSV input accepted by parsers: the whole file as a string, or a text stream
+# (such as an upload) that is read lazily
+CSVContent = Union[str, TextIO]
+
+
+def csv_text_stream(csv_content: CSVContent) -> TextIO:
+    """Return CSV content as a text stream, wrapping strings in StringIO."""
+    return StringIO(csv_content) if isinstance(csv_content, str) else csv_content
+
+
+@dataclass(slots=True)
+class ParsedTool:
+    """Tool record in the standard format shared by all CSV parsers."""
+
+    name: str
+    slug: str
+    description: Optional[str]
+    website_url: Optional[str]
+    logo_url: Optional[str]
+    pricing_type: str  # "free", "paid", "freemium", "one-time", "no-pricing"
+    price_range: Optional[str]
+    has_free_trial: bool
+    tags: Optional[List[str]]
+    features: Optional[List[str]]
+    quality_score: int  # 1-10
+    popularity_score: int
+    is_featured: bool
+    source: str
 
 
 class BaseCSVParser(ABC):
     """Abstract base class for CSV parsers from different sources."""
 
+    # Keys every parsed tool carries once serialized for the database
+    REQUIRED_OUTPUT_FIELDS: FrozenSet[str] = frozenset(field.name for field in fields(ParsedTool))
+
     @property
     @abstractmethod
     def source_name(self) -> str:
@@ -20,41 +54,29 @@ class BaseCSVParser(ABC):
         pass
 
     @abstractmethod
-    def parse_csv_content(self, csv_content: str) -> List[Dict[str, Any]]:
+    def parse_csv_content(self, csv_content: CSVContent) -> Iterable[ParsedTool]:
         """
         Parse CSV content and convert to standardized tool format.
 
+        Parsers may return a list or lazily yield tools; importers consume the
+        result in chunks without materializing it.
+
         Args:
-            csv_content (str): Raw CSV content as string
+            csv_content (CSVContent): Raw CSV content as a string or text stream
 
         Returns:
-            List[Dict]: List of tool dictionaries in standard format:
-            {
-                "name": str,
-                "slug": str,
-                "description": str,
-                "website_url": Optional[str],
-                "logo_url": Optional[str],
-                "pricing_type": str,  # "free", "paid", "freemium", "one-time", "no-pricing"
-                "price_range": Optional[str],
-                "has_free_trial": bool,
-                "tags": Optional[List[str]],
-                "features": Optional[List[str]],
-                "quality_score": int,  # 1-10
-                "popularity_score": int,
-                "is_featured": bool,
-                "source": str
-            }
+            Iterable[ParsedTool]: Tools in standard format
         """
         pass
 
     @abstractmethod
-    def validate_csv_format(self, csv_content: str) -> bool:
+    def validate_csv_format(self, csv_content: CSVContent) -> bool:
         """
         Validate that the CSV has the expected format for this source.
 
         Args:
-            csv_content (str): CSV content to validate
+            csv_content (CSVContent): CSV content to validate; streams are read
+                from their current position
 
         Returns:
             bool: True if format is valid for this source
@@ -1,7 +1,7 @@
 """Factory for creating CSV importers for different sources."""
 
 import logging
-from typing import Dict, Type
+from typing import Dict, FrozenSet, Type
 
 from app.services.base_csv_importer import BaseCSVImporter
 from app.services.taaft_csv_importer import TAaftCSVImporter
@@ -22,6 +22,14 @@ class CSVImporterFactory:
         # Example: "producthunt.com": ProductHuntCSVImporter,
     }
 
+    # Normalized source keys, kept in sync with _importers by register_importer
+    _supported_sources: FrozenSet[str] = frozenset(_importers)
+    # Source list quoted in unsupported-source errors, rebuilt on registration
+    _available_sources: str = ", ".join(_importers)
+
+    # Importers hold no per-request state, so one instance per class is shared
+    _instances: Dict[Type[BaseCSVImporter], BaseCSVImporter] = {}
+
     @classmethod
     def get_importer(cls, source: str) -> BaseCSVImporter:
         """
@@ -31,21 +39,24 @@ class CSVImporterFactory:
             source (str): Source identifier (e.g., 'taaft', 'theresanaiforthat')
 
         Returns:
-            BaseCSVImporter: Appropriate CSV importer instance
+            BaseCSVImporter: Shared CSV importer instance for the source
 
         Raises:
             ValueError: If source is not supported
         """
         source_key = source.lower().strip()
 
-        if source_key not in cls._importers:
-            available_sources = ", ".join(cls._importers.keys())
+        if source_key not in cls._supported_sources:
             raise ValueError(
-                f"Unsupported source '{source}'. Available sources: {available_sources}"
+                f"Unsupported source '{source}'. Available sources: {cls._available_sources}"
             )
 
         importer_class = cls._importers[source_key]
-        return importer_class()
+        importer = cls._instances.get(importer_class)
+        if importer is None:
+            importer = importer_class()
+            cls._instances[importer_class] = importer
+        return importer
 
     @classmethod
     def register_importer(cls, source: str, importer_class: Type[BaseCSVImporter]) -> None:
@@ -59,7 +70,10 @@ class CSVImporterFactory:
         if not issubclass(importer_class, BaseCSVImporter):
             raise ValueError("Importer class must inherit from BaseCSVImporter")
 
-        cls._importers[source.lower().strip()] = importer_class
+        source_key = source.lower().strip()
+        cls._importers[source_key] = importer_class
+        cls._supported_sources = cls._supported_sources | {source_key}
+        cls._available_sources = ", ".join(cls._importers)
         logger.info(f"Registered CSV importer for source: {source}")
 
     @classmethod
@@ -70,4 +84,4 @@ class CSVImporterFactory:
     @classmethod
     def is_source_supported(cls, source: str) -> bool:
         """Check if a source is supported."""
-        return source.lower().strip() in cls._importers
+        return source.lower().strip() in cls._supported_sources
@@ -1,17 +1,107 @@
 """CSV parser service for theresanaiforthat.com scraping results."""
 
+import csv
 import logging
 import re
 import urllib.parse
-from io import StringIO
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Mapping, Optional
 
-import pandas as pd
-
-from app.services.base_csv_parser import BaseCSVParser
+from app.services.base_csv_parser import BaseCSVParser, CSVContent, ParsedTool, csv_text_stream
 
 logger = logging.getLogger(__name__)
 
+# Pricing markers found in the "ai_launch_date" column and the type each implies
+_PRICING_MARKERS = {
+    "100% free": "free",
+    "free +": "freemium",
+    "free trial": "freemium",
+    "from $": "paid",
+    "/mo": "paid",
+    "one-time": "one-time",
+    "buy once": "one-time",
+}
+# When several markers match, the earliest type in this order wins
+_PRICING_PRECEDENCE = ("free", "freemium", "paid", "one-time")
+_PRICING_RE = re.compile("|".join(re.escape(marker) for marker in _PRICING_MARKERS))
+
+# Minimum columns a TAAFT CSV header must contain
+_REQUIRED_COLUMNS = frozenset({"ai_link"})
+
+# Slug patterns: drop special characters, then collapse whitespace/hyphen runs
+_SLUG_STRIP = re.compile(r"[^a-z0-9\s-]")
+_SLUG_SEPARATORS = re.compile(r"[\s-]+")
+
+
+def _clean(value: Any) -> Optional[str]:
+    """Strip string values, mapping blanks and non-strings to None."""
+    if not isinstance(value, str):
+        return None
+    return value.strip() or None
+
+
+def _lower(value: Any) -> Optional[str]:
+    """Lowercase string values, mapping non-strings to None."""
+    return value.lower() if isinstance(value, str) else None
+
+
+def _pricing_type(pricing: Optional[str]) -> str:
+    """Classify an already lowercased pricing string."""
+    if pricing is None:
+        return "no-pricing"
+    if pricing == "free":
+        return "free"
+
+    # One regex pass collects every marker instead of a substring scan per marker
+    found = {_PRICING_MARKERS[marker] for marker in _PRICING_RE.findall(pricing)}
+    return next((ptype for ptype in _PRICING_PRECEDENCE if ptype in found), "no-pricing")
+
+
+def _has_free_trial(pricing: Optional[str]) -> bool:
+    """Check an already lowercased pricing string for a free tier or trial."""
+    return pricing is not None and ("free" in pricing or "trial" in pricing)
+
+
+def _tags(task_label: Optional[str], pricing_type: str) -> Optional[List[str]]:
+    """Build tags from a cleaned task label and its pricing type."""
+    tags = [
+        tag
+        for tag in (
+            task_label and task_label.lower(),
+            pricing_type if pricing_type in ("free", "freemium") else None,
+        )
+        if tag
+    ]
+    return tags or None
+
+
+def _features(rating: Optional[float], has_comment: bool) -> Optional[List[str]]:
+    """Build features from a rating and whether the tool has a user comment."""
+    features = [
+        feature
+        for feature in (
+            "highly-rated" if rating is not None and rating >= 4.5 else None,
+            "user-reviewed" if has_comment else None,
+        )
+        if feature
+    ]
+    return features or None
+
+
+def _to_int(value: Any, default: int = 0) -> int:
+    """Convert a CSV cell to int, falling back to default."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Convert a CSV cell to float, or None if it is not numeric."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
 
 class TAaftCSVParser(BaseCSVParser):
     """Parser for theresanaiforthat.com CSV scraping results."""
@@ -39,14 +129,15 @@ class TAaftCSVParser(BaseCSVParser):
             "comment_body",
         ]
 
-    def validate_csv_format(self, csv_content: str) -> bool:
+    def validate_csv_format(self, csv_content: CSVContent) -> bool:
         """Validate that CSV has TAAFT format."""
         try:
-            df = pd.read_csv(StringIO(csv_content))
-
-            # Check for required columns
-            required_cols = ["ai_link"]  # Minimum required
-            missing_cols = [col for col in required_cols if col not in df.columns]
+            # Only the header row is needed to check the columns
+            header = next(csv.reader(csv_text_stream(csv_content)), None)
+            if not header:
+                raise ValueError("CSV content is empty")
+            # Check for required columns with one set difference
+            missing_cols = sorted(_REQUIRED_COLUMNS.difference(col.strip() for col in header))
 
             if missing_cols:
                 raise ValueError(
@@ -69,98 +160,114 @@ class TAaftCSVParser(BaseCSVParser):
             '"Writing","Free + from $20/mo","1,500","25","4.5","Great AI tool"'
         )
 
-    def parse_csv_content(self, csv_content: str) -> List[Dict[str, Any]]:
+    def parse_csv_content(self, csv_content: CSVContent) -> Iterator[ParsedTool]:
         """
-        Parse CSV content and convert to database-ready format.
+        Lazily parse CSV content and convert to database-ready format.
 
         Args:
-            csv_content (str): CSV content as string
+            csv_content (CSVContent): CSV content as a string or text stream
 
-        Returns:
-            List[Dict]: List of tool dictionaries ready for database insertion
+        Yields:
+            ParsedTool: One tool ready for database insertion at a time
         """
         try:
-            # Read CSV from string content
-            df = pd.read_csv(StringIO(csv_content))
-
-            # Clean column names (remove extra spaces)
-            df.columns = df.columns.str.strip()
-
-            logger.info(f"Loaded CSV with {len(df)} rows and {len(df.columns)} columns")
+            parsed = 0
+            for row in self.iter_csv_rows(csv_content):
+                # Skip rows without tool names
+                if not row.get("ai_link"):
+                    continue
 
-            # Filter out rows without tool names
-            mask = df["ai_link"].notna() & (df["ai_link"] != "")
-            df = df[mask]
-
-            tools = []
-            for idx, row in df.iterrows():
                 tool = self.transform_row(row)
                 if tool:
-                    tools.append(tool)
+                    parsed += 1
+                    yield tool
 
-            logger.info(f"Successfully parsed {len(tools)} tools from CSV")
-            return tools
+            logger.info(f"Successfully parsed {parsed} tools from CSV")
 
         except Exception as e:
             logger.error(f"Error parsing CSV: {e}")
             raise
 
-    def transform_row(self, row: pd.Series) -> Optional[Dict[str, Any]]:
+    def iter_csv_rows(self, csv_content: CSVContent) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield CSV rows as dictionaries keyed by stripped column names.
+
+        Args:
+            csv_content (CSVContent): CSV content as a string or text stream
+
+        Yields:
+            Dict: One CSV row at a time
+        """
+        reader = csv.DictReader(csv_text_stream(csv_content))
+
+        # Clean column names (remove extra spaces)
+        if reader.fieldnames:
+            reader.fieldnames = [name.strip() for name in reader.fieldnames]
+            logger.info(f"Loaded CSV with {len(reader.fieldnames)} columns")
+
+        yield from reader
+
+    def transform_row(self, row: Mapping[str, Any]) -> Optional[ParsedTool]:
         """
         Transform a CSV row into a database tool object.
 
         Args:
-            row (pd.Series): CSV row
+            row (Mapping): CSV row
 
         Returns:
-            Dict or None: Database-ready tool object or None if invalid
+            ParsedTool or None: Database-ready tool object or None if invalid
         """
         try:
-            name = self.clean_string(row.get("ai_link"))
+            name = _clean(row.get("ai_link"))
             if not name:
                 return None
 
-            return {
-                "name": name,
-                "slug": self.generate_slug(name),
-                "description": self.extract_description(row),
-                "website_url": self.clean_url(
-                    row.get("external_ai_link href") or row.get("visit_ai_website_link href")
+            # Shared inputs are computed once and reused for tags and features
+            task_label = _clean(row.get("task_label"))
+            pricing_str = row.get("ai_launch_date")
+            pricing = _lower(pricing_str)  # lowercased once for every pricing check
+            pricing_type = _pricing_type(pricing)
+            rating = _to_float(row.get("average_rating"))
+            has_comment = _clean(row.get("comment_body")) is not None
+
+            return ParsedTool(
+                name=name,
+                slug=self.generate_slug(name),
+                description=self.extract_description(row),
+                # Blank cells read as "", so an empty external link falls back
+                # to the visit-website link, and neither link gives None
+                website_url=self.clean_url(
+                    _clean(row.get("external_ai_link href"))
+                    or _clean(row.get("visit_ai_website_link href"))
                 ),
-                "logo_url": self.clean_string(row.get("taaft_icon src")),
-                "pricing_type": self.extract_pricing_type(row.get("ai_launch_date")),
-                "price_range": self.extract_price_range(row.get("ai_launch_date")),
-                "has_free_trial": self.extract_has_free_trial(row.get("ai_launch_date")),
-                "tags": self.extract_tags(row),
-                "features": self.extract_features(row),
-                "quality_score": self.calculate_quality_score(row),
-                "popularity_score": self.calculate_popularity_score(row),
-                "is_featured": False,  # Default to False
-                "source": self.source_name,
-            }
+                logo_url=_clean(row.get("taaft_icon src")),
+                pricing_type=pricing_type,
+                price_range=self.extract_price_range(pricing_str),
+                has_free_trial=_has_free_trial(pricing),
+                tags=_tags(task_label, pricing_type),
+                features=_features(rating, has_comment),
+                quality_score=self.calculate_quality_score(row),
+                popularity_score=self.calculate_popularity_score(row),
+                is_featured=False,  # Default to False
+                source=self.source_name,
+            )
         except Exception as e:
-            logger.warning(f"Error transforming row for {row.get('ai_link', 'unknown')}: {e}")
+            logger.warning("Error transforming row for %s: %s", row.get("ai_link", "unknown"), e)
             return None
 
     def clean_string(self, value: Any) -> Optional[str]:
         """Clean and normalize string values."""
-        if pd.isna(value) or not isinstance(value, str):
-            return None
-        cleaned = str(value).strip()
-        return cleaned if cleaned else None
+        return _clean(value)
 
     def generate_slug(self, name: str) -> str:
         """Generate URL-friendly slug from name."""
-        slug = name.lower()
-        slug = re.sub(r"[^a-z0-9\s-]", "", slug)  # Remove special characters
-        slug = re.sub(r"\s+", "-", slug)  # Replace spaces with hyphens
-        slug = re.sub(r"--+", "-", slug)  # Replace multiple hyphens
-        slug = slug.strip("-")  # Remove leading/trailing hyphens
-        return slug
+        slug = _SLUG_STRIP.sub("", name.lower())  # Remove special characters
+        slug = _SLUG_SEPARATORS.sub("-", slug)  # Spaces and repeated hyphens -> one hyphen
+        return slug.strip("-")  # Remove leading/trailing hyphens
 
     def clean_url(self, url: Any) -> Optional[str]:
         """Clean URL by removing tracking parameters."""
-        if pd.isna(url) or not isinstance(url, str):
+        if not isinstance(url, str):
             return None
 
         try:
@@ -186,13 +293,13 @@ class TAaftCSVParser(BaseCSVParser):
 
             return urllib.parse.urlunparse(clean_parsed)
         except Exception:
-            logger.warning(f"Invalid URL: {url}")
+            logger.warning("Invalid URL: %s", url)
             return None
 
-    def extract_description(self, row: pd.Series) -> Optional[str]:
+    def extract_description(self, row: Mapping[str, Any]) -> Optional[str]:
         """Extract description from available fields."""
-        task_label = self.clean_string(row.get("task_label"))
-        comment_body = self.clean_string(row.get("comment_body"))
+        task_label = _clean(row.get("task_label"))
+        comment_body = _clean(row.get("comment_body"))
 
         if comment_body and len(comment_body) > 10:
             prefix = f"{task_label}. " if task_label else ""
@@ -202,25 +309,11 @@ class TAaftCSVParser(BaseCSVParser):
 
     def extract_pricing_type(self, pricing_str: Any) -> str:
         """Extract pricing type from pricing string."""
-        if pd.isna(pricing_str) or not isinstance(pricing_str, str):
-            return "no-pricing"
-
-        pricing = pricing_str.lower()
-
-        if "100% free" in pricing or pricing == "free":
-            return "free"
-        elif "free +" in pricing or "free trial" in pricing:
-            return "freemium"
-        elif "from $" in pricing or "/mo" in pricing:
-            return "paid"
-        elif "one-time" in pricing or "buy once" in pricing:
-            return "one-time"
-
-        return "no-pricing"
+        return _pricing_type(_lower(pricing_str))
 
     def extract_price_range(self, pricing_str: Any) -> Optional[str]:
         """Extract price range from pricing string."""
-        if pd.isna(pricing_str) or not isinstance(pricing_str, str):
+        if not isinstance(pricing_str, str):
             return None
 
         # Clean up pricing string for display
@@ -230,98 +323,51 @@ class TAaftCSVParser(BaseCSVParser):
 
     def extract_has_free_trial(self, pricing_str: Any) -> bool:
         """Check if tool has free trial."""
-        if pd.isna(pricing_str) or not isinstance(pricing_str, str):
-            return False
+        return _has_free_trial(_lower(pricing_str))
 
-        pricing = pricing_str.lower()
-        return "free" in pricing or "trial" in pricing
-
-    def extract_tags(self, row: pd.Series) -> Optional[List[str]]:
+    def extract_tags(self, row: Mapping[str, Any]) -> Optional[List[str]]:
         """Extract tags from task label."""
-        tags = []
-
-        task_label = self.clean_string(row.get("task_label"))
-        if task_label:
-            tags.append(task_label.lower())
-
-        # Add pricing-based tags
-        pricing_type = self.extract_pricing_type(row.get("ai_launch_date"))
-        if pricing_type == "free":
-            tags.append("free")
-        elif pricing_type == "freemium":
-            tags.append("freemium")
-
-        return tags if tags else None
+        return _tags(
+            _clean(row.get("task_label")), self.extract_pricing_type(row.get("ai_launch_date"))
+        )
 
-    def extract_features(self, row: pd.Series) -> Optional[List[str]]:
+    def extract_features(self, row: Mapping[str, Any]) -> Optional[List[str]]:
         """Extract features based on available data."""
-        features = []
-
-        # Add features based on rating
-        if not pd.isna(row.get("average_rating")):
-            try:
-                rating = float(row["average_rating"])
-                if rating >= 4.5:
-                    features.append("highly-rated")
-            except (ValueError, TypeError):
-                pass
-
-        # Add feature if has user reviews
-        if self.clean_string(row.get("comment_body")):
-            features.append("user-reviewed")
-
-        return features if features else None
+        return _features(
+            _to_float(row.get("average_rating")), _clean(row.get("comment_body")) is not None
+        )
 
-    def calculate_quality_score(self, row: pd.Series) -> int:
+    def calculate_quality_score(self, row: Mapping[str, Any]) -> int:
         """Calculate quality score based on available metrics."""
         score = 5.0  # Base score
 
         # Boost based on rating
-        if not pd.isna(row.get("average_rating")):
-            try:
-                rating = float(row["average_rating"])
-                if rating >= 4.5:
-                    score += 2
-                elif rating >= 4.0:
-                    score += 1
-                elif rating < 3.0:
-                    score -= 1
-            except (ValueError, TypeError):
-                pass
+        rating = _to_float(row.get("average_rating"))
+        if rating is not None:
+            if rating >= 4.5:
+                score += 2
+            elif rating >= 4.0:
+                score += 1
+            elif rating < 3.0:
+                score -= 1
 
         # Boost if has user comments
-        if self.clean_string(row.get("comment_body")):
+        if _clean(row.get("comment_body")):
             score += 1
 
         # Boost based on saves
-        try:
-            saves = int(row.get("saves", 0))
-            if saves > 50:
-                score += 1
-            elif saves > 20:
-                score += 0.5
-        except (ValueError, TypeError):
-            pass
+        saves = _to_int(row.get("saves"))
+        if saves > 50:
+            score += 1
+        elif saves > 20:
+            score += 0.5
 
         return max(1, min(10, round(score)))
 
-    def calculate_popularity_score(self, row: pd.Series) -> int:
+    def calculate_popularity_score(self, row: Mapping[str, Any]) -> int:
         """Calculate popularity score based on views and saves."""
-        score = 0
-
-        # Parse views
-        try:
-            views_str = str(row.get("stats_views", "0")).replace(",", "")
-            views = int(views_str)
-            score += views // 1000
-        except (ValueError, TypeError):
-            pass
-
-        # Parse saves
-        try:
-            saves = int(row.get("saves", 0))
-            score += saves * 2
-        except (ValueError, TypeError):
-            pass
+        # Views are formatted with thousands separators (e.g. "1,500")
+        views = _to_int(str(row.get("stats_views", "0")).replace(",", ""))
+        saves = _to_int(row.get("saves"))
 
-        return max(0, score)
+        return max(0, views // 1000 + saves * 2)
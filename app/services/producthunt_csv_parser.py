@@ -1,16 +1,60 @@
 """CSV parser service for ProductHunt data - EXAMPLE implementation."""
 
+import csv
 import logging
 import re
-from io import StringIO
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping, Union
 
+import numpy as np
 import pandas as pd
 
-from app.services.base_csv_parser import BaseCSVParser
+from app.services.base_csv_parser import BaseCSVParser, CSVContent, ParsedTool, csv_text_stream
 
 logger = logging.getLogger(__name__)
 
+# Slug patterns: drop special characters, then collapse whitespace/hyphen runs
+_SLUG_STRIP = re.compile(r"[^a-z0-9\s-]")
+_SLUG_SEPARATORS = re.compile(r"[\s-]+")
+
+
+# Minimum columns a ProductHunt CSV header must contain
+_REQUIRED_COLUMNS = frozenset({"name", "tagline"})
+
+# Pricing types in precedence order: the first matching rule wins
+_PRICING_TYPES = ["free", "freemium", "paid", "one-time"]
+# Pricing keyword patterns
+_PAID_RE = re.compile(r"paid|\$|subscription|monthly")
+_ONE_TIME_RE = re.compile(r"one-time|lifetime")
+_FREE_TRIAL_RE = re.compile(r"trial|freemium")
+
+
+def _optional_strings(series: pd.Series) -> pd.Series:
+    """Convert a pandas string column to Python str values with None for missing."""
+    return series.astype(object).where(series.notna(), None)
+
+
+def _stripped(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return a stripped string column with blank or missing cells as <NA>."""
+    if column not in df.columns:
+        return pd.Series(pd.NA, index=df.index, dtype="string")
+    return df[column].astype("string").str.strip().replace("", pd.NA)
+
+
+def _contains(series: pd.Series, pattern: Union[str, re.Pattern[str]]) -> np.ndarray:
+    """Return a plain boolean mask of string cells matching pattern (missing is False).
+
+    Plain strings are matched literally; compiled patterns as regular expressions.
+    """
+    regex = isinstance(pattern, re.Pattern)
+    return series.str.contains(pattern, regex=regex, na=False).to_numpy(dtype=bool)
+
+
+def _counts(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Coerce a count column to int64, treating missing or non-numeric cells as 0."""
+    if column not in df.columns:
+        return np.zeros(len(df), dtype=np.int64)
+    return pd.to_numeric(df[column], errors="coerce").fillna(0).to_numpy(dtype=np.int64)
+
 
 class ProductHuntCSVParser(BaseCSVParser):
     """Example parser for ProductHunt CSV data format."""
@@ -36,14 +80,15 @@ class ProductHuntCSVParser(BaseCSVParser):
             "category",
         ]
 
-    def validate_csv_format(self, csv_content: str) -> bool:
+    def validate_csv_format(self, csv_content: CSVContent) -> bool:
         """Validate that CSV has ProductHunt format."""
         try:
-            df = pd.read_csv(StringIO(csv_content))
-
-            # Check for required columns
-            required_cols = ["name", "tagline"]  # Minimum required
-            missing_cols = [col for col in required_cols if col not in df.columns]
+            # Only the header row is needed to check the columns
+            header = next(csv.reader(csv_text_stream(csv_content)), None)
+            if not header:
+                raise ValueError("CSV content is empty")
+            # Check for required columns with one set difference
+            missing_cols = sorted(_REQUIRED_COLUMNS.difference(col.strip() for col in header))
 
             if missing_cols:
                 raise ValueError(
@@ -67,19 +112,19 @@ class ProductHuntCSVParser(BaseCSVParser):
             '"Freemium","AI Tools"'
         )
 
-    def parse_csv_content(self, csv_content: str) -> List[Dict[str, Any]]:
+    def parse_csv_content(self, csv_content: CSVContent) -> List[ParsedTool]:
         """
         Parse ProductHunt CSV content and convert to standardized format.
 
         Args:
-            csv_content (str): CSV content as string
+            csv_content (CSVContent): CSV content as a string or text stream
 
         Returns:
-            List[Dict]: List of tool dictionaries in standard format
+            List[ParsedTool]: List of tools in standard format
         """
         try:
             # Read CSV with pandas
-            df = pd.read_csv(StringIO(csv_content))
+            df = pd.read_csv(csv_text_stream(csv_content))
 
             # Clean column names
             df.columns = df.columns.str.strip()
@@ -87,10 +132,27 @@ class ProductHuntCSVParser(BaseCSVParser):
             logger.info(f"Loaded ProductHunt CSV with {len(df)} rows")
 
             # Filter out rows without names
-            df = df[df["name"].notna() & (df["name"].str.strip() != "")]
+            names = df["name"].astype("string").str.strip()
+            df = df[names.fillna("") != ""]
+            names = names.loc[df.index]
+
+            # Clean names, slugs and URLs column-wise instead of once per row
+            df = df.assign(
+                _name=_optional_strings(names),
+                _slug=_optional_strings(self._generate_slugs(names)),
+                _website_url=(
+                    _optional_strings(df["website"].astype("string").str.strip())
+                    if "website" in df.columns
+                    else None
+                ),
+                **self._text_columns(df),
+                **self._pricing_columns(df),
+                **self._score_columns(df),
+            )
 
+            # Plain dict records avoid allocating a pd.Series per row
             tools = []
-            for _, row in df.iterrows():
+            for row in df.to_dict("records"):
                 tool = self._transform_row(row)
                 if tool:
                     tools.append(tool)
@@ -102,118 +164,126 @@ class ProductHuntCSVParser(BaseCSVParser):
             logger.error(f"Error parsing ProductHunt CSV: {e}")
             raise
 
-    def _transform_row(self, row: pd.Series) -> Dict[str, Any] | None:
+    def _transform_row(self, row: Mapping[str, Any]) -> ParsedTool | None:
         """Transform a ProductHunt CSV row into standard tool format."""
         try:
-            name = self._clean_string(row.get("name"))
+            name = row.get("_name")
             if not name:
                 return None
 
-            return {
-                "name": name,
-                "slug": self._generate_slug(name),
-                "description": self._extract_description(row),
-                "website_url": self._clean_url(row.get("website")),
-                "logo_url": None,  # ProductHunt CSV might not have logos
-                "pricing_type": self._extract_pricing_type(row.get("pricing")),
-                "price_range": self._extract_price_range(row.get("pricing")),
-                "has_free_trial": self._extract_has_free_trial(row.get("pricing")),
-                "tags": self._extract_tags(row),
-                "features": self._extract_features(row),
-                "quality_score": self._calculate_quality_score(row),
-                "popularity_score": self._calculate_popularity_score(row),
-                "is_featured": False,
-                "source": self.source_name,
-            }
+            return ParsedTool(
+                name=name,
+                slug=row["_slug"],
+                description=row["_description"],
+                website_url=row.get("_website_url"),
+                logo_url=None,  # ProductHunt CSV might not have logos
+                pricing_type=row["_pricing_type"],
+                price_range=row.get("_price_range"),
+                has_free_trial=row["_has_free_trial"],
+                tags=row["_tags"],
+                features=self._extract_features(row),
+                quality_score=row["_quality_score"],
+                popularity_score=row["_popularity_score"],
+                is_featured=False,
+                source=self.source_name,
+            )
         except Exception as e:
             logger.warning(
-                f"Error transforming ProductHunt row for {row.get('name', 'unknown')}: {e}"
+                "Error transforming ProductHunt row for %s: %s", row.get("name", "unknown"), e
             )
             return None
 
-    def _clean_string(self, value: Any) -> str | None:
-        """Clean and normalize string values."""
-        if pd.isna(value):
-            return None
-        cleaned = str(value).strip()
-        return cleaned if cleaned else None
-
-    def _generate_slug(self, name: str) -> str:
-        """Generate URL-friendly slug from name."""
-        slug = name.lower()
-        slug = re.sub(r"[^a-z0-9\s-]", "", slug)
-        slug = re.sub(r"\s+", "-", slug)
-        slug = re.sub(r"--+", "-", slug)
-        slug = slug.strip("-")
-        return slug
-
-    def _clean_url(self, url: Any) -> str | None:
-        """Clean URL."""
-        if pd.isna(url):
-            return None
-        return str(url).strip()
-
-    def _extract_description(self, row: pd.Series) -> str:
-        """Extract description from ProductHunt fields."""
-        description = self._clean_string(row.get("description"))
-        tagline = self._clean_string(row.get("tagline"))
-
-        if description and len(description) > 10:
-            return description
-        elif tagline:
-            return tagline
-        else:
-            return f"ProductHunt tool: {tagline or 'No description available'}"
-
-    def _extract_pricing_type(self, pricing_str: Any) -> str:
-        """Extract pricing type from ProductHunt pricing field."""
-        if pd.isna(pricing_str):
-            return "no-pricing"
-
-        pricing = str(pricing_str).lower()
-
-        if "free" in pricing and "paid" not in pricing:
-            return "free"
-        elif "freemium" in pricing or ("free" in pricing and "paid" in pricing):
-            return "freemium"
-        elif any(word in pricing for word in ["paid", "$", "subscription", "monthly"]):
-            return "paid"
-        elif "one-time" in pricing or "lifetime" in pricing:
-            return "one-time"
-
-        return "no-pricing"
-
-    def _extract_price_range(self, pricing_str: Any) -> str | None:
-        """Extract price range from ProductHunt pricing field."""
-        if pd.isna(pricing_str):
-            return None
-        return str(pricing_str).strip()
+    def _generate_slugs(self, names: pd.Series) -> pd.Series:
+        """Generate URL-friendly slugs for a whole column of names."""
+        return (
+            names.str.lower()
+            .str.replace(_SLUG_STRIP, "", regex=True)
+            .str.replace(_SLUG_SEPARATORS, "-", regex=True)
+            .str.strip("-")
+        )
 
-    def _extract_has_free_trial(self, pricing_str: Any) -> bool:
-        """Check if tool has free trial based on ProductHunt data."""
-        if pd.isna(pricing_str):
-            return False
+    def _text_columns(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """
+        Build descriptions and tags column-wise.
 
-        pricing = str(pricing_str).lower()
-        return "trial" in pricing or "freemium" in pricing
+        Descriptions prefer a description over 10 characters, then the tagline.
+        Tags are the lowercased category and a "by-<maker>" tag.
+        """
+        description = _stripped(df, "description")
+        tagline = _stripped(df, "tagline")
+        use_description = (description.str.len() > 10).fillna(False)
 
-    def _extract_tags(self, row: pd.Series) -> List[str] | None:
-        """Extract tags from ProductHunt data."""
-        tags = []
+        category = _optional_strings(_stripped(df, "category").str.lower())
+        maker = _optional_strings(
+            "by-" + _stripped(df, "maker").str.lower().str.replace(" ", "-", regex=False)
+        )
 
-        # Use category as tag
-        category = self._clean_string(row.get("category"))
-        if category:
-            tags.append(category.lower())
+        return {
+            "_description": _optional_strings(
+                description.where(use_description, tagline).fillna(
+                    "ProductHunt tool: No description available"
+                )
+            ),
+            "_tags": pd.Series(
+                [[tag for tag in pair if tag is not None] or None for pair in zip(category, maker)],
+                index=df.index,
+                dtype=object,
+            ),
+        }
+
+    def _pricing_columns(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Classify the whole pricing column at once."""
+        if "pricing" not in df.columns:
+            return {"_pricing_type": "no-pricing", "_price_range": None, "_has_free_trial": False}
+
+        pricing = df["pricing"].astype("string")
+        lowered = pricing.str.lower()
+
+        has_free = _contains(lowered, "free")
+        has_paid = _contains(lowered, "paid")
+
+        # np.select picks the first matching mask, in _PRICING_TYPES order
+        pricing_type = np.select(
+            [
+                has_free & ~has_paid,
+                _contains(lowered, "freemium") | (has_free & has_paid),
+                _contains(lowered, _PAID_RE),
+                _contains(lowered, _ONE_TIME_RE),
+            ],
+            _PRICING_TYPES,
+            default="no-pricing",
+        )
 
-        # Add maker as tag
-        maker = self._clean_string(row.get("maker"))
-        if maker:
-            tags.append(f"by-{maker.lower().replace(' ', '-')}")
+        return {
+            "_pricing_type": pd.Series(pricing_type.tolist(), index=df.index, dtype=object),
+            "_price_range": _optional_strings(pricing.str.strip()),
+            "_has_free_trial": pd.Series(
+                _contains(lowered, _FREE_TRIAL_RE).tolist(), index=df.index
+            ),
+        }
+
+    def _score_columns(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """Compute quality and popularity scores for all rows at once."""
+        upvotes = _counts(df, "upvotes")
+        comments = _counts(df, "comments_count")
+
+        # Quality: base 5, up to +3 for upvotes and +1 for comments, clipped to 1-10.
+        # Popularity: 1 point per 10 upvotes plus 1 per 5 comments.
+        quality = (
+            5.0
+            + np.select([upvotes > 1000, upvotes > 500, upvotes > 100], [3, 2, 1], default=0)
+            + np.select([comments > 100, comments > 50], [1.0, 0.5], default=0.0)
+        )
+        popularity = np.maximum(0, upvotes // 10 + comments // 5)
 
-        return tags if tags else None
+        return {
+            "_quality_score": pd.Series(
+                np.clip(np.round(quality), 1, 10).astype(int).tolist(), index=df.index
+            ),
+            "_popularity_score": pd.Series(popularity.tolist(), index=df.index),
+        }
 
-    def _extract_features(self, row: pd.Series) -> List[str] | None:
+    def _extract_features(self, row: Mapping[str, Any]) -> List[str] | None:
         """Extract features from ProductHunt data."""
         features = []
 
@@ -238,55 +308,3 @@ class ProductHuntCSVParser(BaseCSVParser):
             pass
 
         return features if features else None
-
-    def _calculate_quality_score(self, row: pd.Series) -> int:
-        """Calculate quality score based on ProductHunt metrics."""
-        score = 5.0  # Base score
-
-        # Boost based on upvotes
-        try:
-            upvotes = int(row.get("upvotes", 0)) if not pd.isna(row.get("upvotes")) else 0
-            if upvotes > 1000:
-                score += 3
-            elif upvotes > 500:
-                score += 2
-            elif upvotes > 100:
-                score += 1
-        except (ValueError, TypeError):
-            pass
-
-        # Boost based on comments (engagement)
-        try:
-            comments = (
-                int(row.get("comments_count", 0)) if not pd.isna(row.get("comments_count")) else 0
-            )
-            if comments > 100:
-                score += 1
-            elif comments > 50:
-                score += 0.5
-        except (ValueError, TypeError):
-            pass
-
-        return max(1, min(10, round(score)))
-
-    def _calculate_popularity_score(self, row: pd.Series) -> int:
-        """Calculate popularity score based on ProductHunt metrics."""
-        score = 0
-
-        # Use upvotes as primary popularity metric
-        try:
-            upvotes = int(row.get("upvotes", 0)) if not pd.isna(row.get("upvotes")) else 0
-            score += upvotes // 10  # 1 point per 10 upvotes
-        except (ValueError, TypeError):
-            pass
-
-        # Add comment engagement
-        try:
-            comments = (
-                int(row.get("comments_count", 0)) if not pd.isna(row.get("comments_count")) else 0
-            )
-            score += comments // 5  # 1 point per 5 comments
-        except (ValueError, TypeError):
-            pass
-
-        return max(0, score)
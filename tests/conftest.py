@@ -0,0 +1,14 @@
+"""Shared pytest fixtures."""
+
+import httpx
+import pytest_asyncio
+
+from app.main import app
+
+
+@pytest_asyncio.fixture
+async def client():
+    """Async HTTP client calling the app in-process through ASGITransport."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
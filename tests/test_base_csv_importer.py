@@ -1,8 +1,54 @@
 """Unit tests for base CSV importer."""
 
+import asyncio
+import threading
+import time
+from dataclasses import asdict
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
-from unittest.mock import Mock, patch
+
 from app.services.base_csv_importer import BaseCSVImporter
+from app.services.base_csv_parser import ParsedTool
+
+
+# Tools returned by MockParser, built once for the whole module
+_FIXTURE_TOOLS = (
+    ParsedTool(
+        name="Test Tool 1",
+        slug="test-tool-1",
+        description="A test tool",
+        website_url="https://test1.com",
+        logo_url=None,
+        pricing_type="free",
+        price_range=None,
+        has_free_trial=False,
+        tags=["test"],
+        features=None,
+        quality_score=5,
+        popularity_score=10,
+        is_featured=False,
+        source="test.com",
+    ),
+    ParsedTool(
+        name="Test Tool 2",
+        slug="test-tool-2",
+        description="Another test tool",
+        website_url="https://test2.com",
+        logo_url=None,
+        pricing_type="paid",
+        price_range="$10/month",
+        has_free_trial=True,
+        tags=["test", "paid"],
+        features=["api"],
+        quality_score=8,
+        popularity_score=25,
+        is_featured=False,
+        source="test.com",
+    ),
+)
 
 
 class MockParser:
@@ -16,47 +62,29 @@ class MockParser:
         return self._source_name
     
     def validate_csv_format(self, csv_content):
-        if "invalid" in csv_content:
+        if csv_content.startswith("invalid"):
             raise ValueError("Invalid format")
         return True
     
     def parse_csv_content(self, csv_content):
-        if "empty" in csv_content:
-            return []
-        return [
-            {
-                "name": "Test Tool 1",
-                "slug": "test-tool-1",
-                "description": "A test tool",
-                "website_url": "https://test1.com",
-                "logo_url": None,
-                "pricing_type": "free",
-                "price_range": None,
-                "has_free_trial": False,
-                "tags": ["test"],
-                "features": None,
-                "quality_score": 5,
-                "popularity_score": 10,
-                "is_featured": False,
-                "source": "test.com"
-            },
-            {
-                "name": "Test Tool 2", 
-                "slug": "test-tool-2",
-                "description": "Another test tool",
-                "website_url": "https://test2.com",
-                "logo_url": None,
-                "pricing_type": "paid",
-                "price_range": "$10/month",
-                "has_free_trial": True,
-                "tags": ["test", "paid"],
-                "features": ["api"],
-                "quality_score": 8,
-                "popularity_score": 25,
-                "is_featured": False,
-                "source": "test.com"
-            }
-        ]
+        if csv_content.startswith("empty"):
+            return
+        yield from _FIXTURE_TOOLS
+
+
+class FakeQuery:
+    """Fluent stand-in for the Supabase query builder, cheaper than chained Mocks."""
+
+    def __init__(self, data=None, respond=None):
+        self.data = data
+        # Optional callable mapping an upserted batch to the returned rows
+        self.respond = respond
+        self.upserts = []
+
+    def upsert(self, records, **kwargs):
+        self.upserts.append((records, kwargs))
+        respond = self.respond or (lambda batch: self.data)
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=respond(records)))
 
 
 class MockImporter(BaseCSVImporter):
@@ -77,39 +105,74 @@ class MockImporter(BaseCSVImporter):
 class TestBaseCSVImporter:
     """Test suite for base CSV importer."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_client = Mock()
+    @pytest.fixture(autouse=True)
+    def patch_db_connection(self):
+        """Keep the database connection patched for the whole test body."""
         with patch('app.services.base_csv_importer.db_connection') as mock_db_connection:
-            mock_db_connection.get_client.return_value = self.mock_client
+            self.mock_client = mock_db_connection.get_client.return_value
+            self.query = FakeQuery()
+            self.mock_client.table.return_value = self.query
             self.importer = MockImporter()
-            self.importer.client = self.mock_client
+            yield
 
-    @patch('app.services.base_csv_importer.db_connection')
-    def test_init(self, mock_db_connection):
+    def test_init(self):
         """Test importer initialization."""
-        mock_db_connection.get_client.return_value = self.mock_client
         importer = MockImporter()
-        assert importer.client == mock_db_connection.get_client.return_value
+        assert importer.client is self.mock_client
 
     @pytest.mark.asyncio
     async def test_import_from_csv_content_success(self):
         """Test successful CSV import."""
+        # One tool per chunk so the parse/insert pipeline hands over two chunks
+        self.importer.BULK_BATCH_SIZE = 1
+        self.importer.MAX_CONCURRENT_BATCHES = 1
         with patch.object(self.importer, 'bulk_insert_tools') as mock_bulk_insert:
             mock_bulk_insert.return_value = {
-                "imported": 2, 
+                "imported": 1, 
                 "skipped": 0, 
                 "errors": 0
             }
             
             result = await self.importer.import_from_csv_content("valid csv content")
             
+            assert mock_bulk_insert.await_count == 2
             assert result["success"] is True
             assert result["total_parsed"] == 2
             assert result["imported"] == 2
             assert result["source"] == "test.com"
             assert "Successfully processed 2 tools" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_import_from_csv_content_serializes_parsed_tools(self):
+        """Test that parsed tools only become dicts in the upsert payload."""
+        self.query.respond = lambda batch: batch
+
+        result = await self.importer.import_from_csv_content("valid csv content")
+
+        assert result["imported"] == 2
+        [(records, _)] = self.query.upserts
+        assert records == [asdict(tool) for tool in _FIXTURE_TOOLS]
+
+    @pytest.mark.asyncio
+    async def test_import_from_csv_content_rewinds_stream_after_validation(self):
+        """Test that a text stream is parsed from the start after header validation."""
+        stream = StringIO("header\nrow\n")
+        parsed = {}
+
+        def validate_csv_format(csv_content):
+            csv_content.readline()
+            return True
+
+        def parse_csv_content(csv_content):
+            parsed["content"] = csv_content.read()
+            return []
+
+        with patch.object(self.importer.parser, 'validate_csv_format', validate_csv_format), \
+                patch.object(self.importer.parser, 'parse_csv_content', parse_csv_content):
+            await self.importer.import_from_csv_content(stream)
+
+        assert parsed["content"] == "header\nrow\n"
+
     @pytest.mark.asyncio
     async def test_import_from_csv_content_no_tools(self):
         """Test CSV import with no valid tools."""
@@ -140,6 +203,136 @@ class TestBaseCSVImporter:
             assert result["errors"] == 1
             assert "Import failed" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_import_streams_without_full_materialization(self):
+        """Test that parsed tools are inserted chunk by chunk as they are produced."""
+        self.importer.BULK_BATCH_SIZE = 1
+        self.importer.MAX_CONCURRENT_BATCHES = 2
+        pulled = 0
+
+        def parse_csv_content(csv_content):
+            nonlocal pulled
+            for i in range(20):
+                pulled += 1
+                yield {"slug": f"test-{i}", "name": f"Test {i}"}
+
+        pulled_at_insert = []
+
+        async def bulk_insert_tools(tools, replace_existing=False, known_slugs=None):
+            pulled_at_insert.append(pulled)
+            return {"imported": len(tools), "skipped": 0, "errors": 0}
+
+        with patch.object(self.importer.parser, 'parse_csv_content', parse_csv_content), \
+                patch.object(self.importer, 'bulk_insert_tools', bulk_insert_tools):
+            result = await self.importer.import_from_csv_content("valid csv")
+
+        # Chunks of BULK_BATCH_SIZE * MAX_CONCURRENT_BATCHES tools; the parser
+        # runs at most MAX_QUEUED_CHUNKS + 1 chunks ahead of the inserts
+        assert len(pulled_at_insert) == 10
+        assert pulled_at_insert[0] <= 2 * (self.importer.MAX_QUEUED_CHUNKS + 1)
+        assert result["total_parsed"] == 20
+        assert result["imported"] == 20
+
+    @pytest.mark.asyncio
+    async def test_import_parses_off_the_event_loop_thread(self):
+        """Test that CSV parsing runs in worker threads, not on the event loop."""
+        loop_thread = threading.get_ident()
+        parse_threads = set()
+
+        def parse_csv_content(csv_content):
+            parse_threads.add(threading.get_ident())
+            for tool in _FIXTURE_TOOLS:
+                parse_threads.add(threading.get_ident())
+                yield tool
+
+        with patch.object(self.importer.parser, 'parse_csv_content', parse_csv_content), \
+                patch.object(self.importer, 'bulk_insert_tools') as mock_bulk_insert:
+            mock_bulk_insert.return_value = {"imported": 2, "skipped": 0, "errors": 0}
+            result = await self.importer.import_from_csv_content("valid csv")
+
+        assert result["total_parsed"] == 2
+        assert parse_threads and loop_thread not in parse_threads
+
+    @pytest.mark.asyncio
+    async def test_import_parse_error_mid_stream(self):
+        """Test that a parser failure after some chunks reports the partial import."""
+        self.importer.BULK_BATCH_SIZE = 1
+        self.importer.MAX_CONCURRENT_BATCHES = 1
+        self.query.respond = lambda batch: [tool for tool in batch if tool["slug"] != "test-1"]
+
+        def parse_csv_content(csv_content):
+            for i in range(3):
+                yield {"slug": f"test-{i}", "name": f"Test {i}"}
+            raise ValueError("bad row")
+
+        with patch.object(self.importer.parser, 'parse_csv_content', parse_csv_content):
+            result = await self.importer.import_from_csv_content("valid csv")
+
+        # The chunks written before the failure are counted, not reported as zero
+        assert result["success"] is False
+        assert "partially completed" in result["message"]
+        assert "bad row" in result["message"]
+        assert result["total_parsed"] == 3
+        assert result["imported"] == 2
+        assert result["skipped"] == 1
+        assert result["errors"] == 1
+        assert len(self.query.upserts) == 3
+
+    @pytest.mark.asyncio
+    async def test_import_insert_error_keeps_partial_counts(self):
+        """Test that a failing insert stops the producer and keeps earlier counts."""
+        self.importer.BULK_BATCH_SIZE = 1
+        self.importer.MAX_CONCURRENT_BATCHES = 1
+
+        def parse_csv_content(csv_content):
+            for i in range(10):
+                yield {"slug": f"test-{i}", "name": f"Test {i}"}
+
+        async def bulk_insert_tools(tools, replace_existing=False, known_slugs=None):
+            if tools[0]["slug"] == "test-2":
+                raise RuntimeError("connection lost")
+            return {"imported": len(tools), "skipped": 0, "errors": 0}
+
+        with patch.object(self.importer.parser, 'parse_csv_content', parse_csv_content), \
+                patch.object(self.importer, 'bulk_insert_tools', bulk_insert_tools):
+            result = await self.importer.import_from_csv_content("valid csv")
+
+        assert result["success"] is False
+        assert "connection lost" in result["message"]
+        assert result["total_parsed"] == 3
+        assert result["imported"] == 2
+        assert result["errors"] == 1
+        # The producer task was awaited rather than left running
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    @pytest.mark.asyncio
+    async def test_import_insert_error_waits_for_parser_thread(self):
+        """Test that a failed import returns only after the parser thread stops reading."""
+        self.importer.BULK_BATCH_SIZE = 5
+        self.importer.MAX_CONCURRENT_BATCHES = 1
+        pulled = 0
+
+        def parse_csv_content(csv_content):
+            nonlocal pulled
+            for i in range(100):
+                time.sleep(0.005)
+                pulled += 1
+                yield {"slug": f"test-{i}", "name": f"Test {i}"}
+
+        async def bulk_insert_tools(tools, replace_existing=False, known_slugs=None):
+            raise RuntimeError("connection lost")
+
+        with patch.object(self.importer.parser, 'parse_csv_content', parse_csv_content), \
+                patch.object(self.importer, 'bulk_insert_tools', bulk_insert_tools):
+            result = await self.importer.import_from_csv_content("valid csv")
+            pulled_at_return = pulled
+            time.sleep(0.1)
+
+        assert result["success"] is False
+        # The in-flight chunk finished, and nothing read the stream afterwards
+        assert pulled == pulled_at_return
+        assert pulled < 100
+
     @pytest.mark.asyncio
     async def test_bulk_insert_tools_empty_list(self):
         """Test bulk insert with empty tools list."""
@@ -151,11 +344,7 @@ class TestBaseCSVImporter:
     async def test_bulk_insert_tools_replace_existing_true(self):
         """Test bulk insert with replace_existing=True (upsert)."""
         tools = [{"slug": "test-1", "name": "Test 1"}]
-        
-        # Mock successful upsert response
-        mock_response = Mock()
-        mock_response.data = tools
-        self.importer.client.table.return_value.upsert.return_value.execute.return_value = mock_response
+        self.query.data = tools
         
         result = await self.importer.bulk_insert_tools(tools, replace_existing=True)
         
@@ -165,88 +354,220 @@ class TestBaseCSVImporter:
         
         # Verify upsert was called
         self.importer.client.table.assert_called_with("tools")
-        self.importer.client.table.return_value.upsert.assert_called_with(tools, on_conflict="slug")
+        assert self.query.upserts == [(tools, {"on_conflict": "slug", "ignore_duplicates": False})]
 
     @pytest.mark.asyncio
-    async def test_bulk_insert_tools_replace_existing_false_no_conflicts(self):
-        """Test bulk insert with replace_existing=False and no existing tools."""
+    @pytest.mark.parametrize(
+        "existing_slugs, expected_imported, expected_skipped",
+        [
+            (set(), 3, 0),  # no conflicts
+            ({"test-1", "test-3"}, 1, 2),  # only test-2 is new
+            ({"test-1", "test-2", "test-3"}, 0, 3),  # all tools already exist
+        ],
+    )
+    async def test_bulk_insert_tools_replace_existing_false(
+        self, existing_slugs, expected_imported, expected_skipped
+    ):
+        """Test bulk insert with replace_existing=False against existing tools."""
         tools = [
             {"slug": "test-1", "name": "Test 1"},
-            {"slug": "test-2", "name": "Test 2"}
+            {"slug": "test-2", "name": "Test 2"},
+            {"slug": "test-3", "name": "Test 3"}
         ]
         
-        # Mock no existing tools found
-        mock_select_response = Mock()
-        mock_select_response.data = []
-        self.importer.client.table.return_value.select.return_value.in_.return_value.execute.return_value = mock_select_response
-        
-        # Mock successful insert
-        mock_insert_response = Mock()
-        mock_insert_response.data = tools
-        self.importer.client.table.return_value.insert.return_value.execute.return_value = mock_insert_response
+        # The database only returns the rows it actually inserted
+        self.query.respond = lambda batch: [
+            tool for tool in batch if tool["slug"] not in existing_slugs
+        ]
         
         result = await self.importer.bulk_insert_tools(tools, replace_existing=False)
         
-        assert result["imported"] == 2
-        assert result["skipped"] == 0
+        assert result["imported"] == expected_imported
+        assert result["skipped"] == expected_skipped
         assert result["errors"] == 0
 
+        # Conflicts are resolved by the database in the same request
+        assert self.query.upserts == [(tools, {"on_conflict": "slug", "ignore_duplicates": True})]
+
     @pytest.mark.asyncio
-    async def test_bulk_insert_tools_replace_existing_false_with_conflicts(self):
-        """Test bulk insert with replace_existing=False and some existing tools."""
+    async def test_bulk_insert_tools_skips_duplicate_slugs_within_batch(self):
+        """Test that repeated slugs in one import are only sent once."""
         tools = [
             {"slug": "test-1", "name": "Test 1"},
-            {"slug": "test-2", "name": "Test 2"},
-            {"slug": "test-3", "name": "Test 3"}
-        ]
-        
-        # Mock existing tools (test-1 and test-3 exist)
-        mock_select_response = Mock()
-        mock_select_response.data = [
-            {"slug": "test-1"},
-            {"slug": "test-3"}
+            {"slug": "test-1", "name": "Test 1 again"},
+            {"slug": "test-2", "name": "Test 2"}
         ]
-        self.importer.client.table.return_value.select.return_value.in_.return_value.execute.return_value = mock_select_response
-        
-        # Mock successful insert of new tool
-        mock_insert_response = Mock()
-        mock_insert_response.data = [{"slug": "test-2", "name": "Test 2"}]
-        self.importer.client.table.return_value.insert.return_value.execute.return_value = mock_insert_response
-        
+        self.query.data = [tools[0], tools[2]]
+
         result = await self.importer.bulk_insert_tools(tools, replace_existing=False)
-        
-        assert result["imported"] == 1  # Only test-2 was inserted
-        assert result["skipped"] == 2   # test-1 and test-3 were skipped
-        assert result["errors"] == 0
-        
-        # Verify only new tool was inserted
-        expected_new_tools = [{"slug": "test-2", "name": "Test 2"}]
-        self.importer.client.table.return_value.insert.assert_called_with(expected_new_tools)
+
+        assert result["imported"] == 2
+        assert result["skipped"] == 1
+        assert self.query.upserts == [
+            ([tools[0], tools[2]], {"on_conflict": "slug", "ignore_duplicates": True})
+        ]
 
     @pytest.mark.asyncio
-    async def test_bulk_insert_tools_replace_existing_false_all_exist(self):
-        """Test bulk insert when all tools already exist."""
+    async def test_bulk_insert_tools_skips_known_slugs(self):
+        """Test that slugs stored earlier in the same import skip the database."""
         tools = [
             {"slug": "test-1", "name": "Test 1"},
             {"slug": "test-2", "name": "Test 2"}
         ]
-        
-        # Mock all tools exist
-        mock_select_response = Mock()
-        mock_select_response.data = [
-            {"slug": "test-1"},
-            {"slug": "test-2"}
-        ]
-        self.importer.client.table.return_value.select.return_value.in_.return_value.execute.return_value = mock_select_response
-        
+        self.query.data = [tools[0]]  # test-2 already existed
+        known_slugs = set()
+
+        first = await self.importer.bulk_insert_tools(tools, False, known_slugs)
+        second = await self.importer.bulk_insert_tools(tools, False, known_slugs)
+
+        assert first == {"imported": 1, "skipped": 1, "errors": 0}
+        assert second == {"imported": 0, "skipped": 2, "errors": 0}
+        assert known_slugs == {"test-1", "test-2"}
+        assert self.mock_client.table.call_count == 1
+
+        # Replacing still sends known slugs so their rows are updated
+        await self.importer.bulk_insert_tools(tools, True, known_slugs)
+        assert self.query.upserts[-1] == (
+            tools, {"on_conflict": "slug", "ignore_duplicates": False}
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_tools_failed_batch_slugs_not_known(self):
+        """Test that slugs from a failed sub-batch are retried by later chunks."""
+        tools = [{"slug": "test-1", "name": "Test 1"}]
+        known_slugs = set()
+
+        def respond(batch):
+            raise Exception("DB Error")
+
+        self.query.respond = respond
+
+        await self.importer.bulk_insert_tools(tools, False, known_slugs)
+
+        assert known_slugs == set()
+
+    @pytest.mark.asyncio
+    async def test_import_skips_slugs_repeated_across_chunks(self):
+        """Test that a slug already stored by an earlier chunk is not sent again."""
+        self.importer.BULK_BATCH_SIZE = 1
+        self.importer.MAX_CONCURRENT_BATCHES = 1
+        self.query.respond = lambda batch: batch
+
+        def parse_csv_content(csv_content):
+            yield {"slug": "test-1", "name": "Test 1"}
+            yield {"slug": "test-1", "name": "Test 1 again"}
+
+        with patch.object(self.importer.parser, 'parse_csv_content', parse_csv_content):
+            result = await self.importer.import_from_csv_content("valid csv")
+
+        assert result["imported"] == 1
+        assert result["skipped"] == 1
+        assert len(self.query.upserts) == 1
+
+    @pytest.mark.asyncio
+    async def test_import_reinserts_slug_deleted_between_imports(self):
+        """Test that known slugs do not outlive one import call."""
+        stored = set()
+
+        def respond(batch):
+            # ON CONFLICT DO NOTHING: only slugs not stored yet come back
+            inserted = [tool for tool in batch if tool["slug"] not in stored]
+            stored.update(tool["slug"] for tool in inserted)
+            return inserted
+
+        self.query.respond = respond
+
+        first = await self.importer.import_from_csv_content("valid csv content")
+        stored.discard("test-tool-1")  # deleted from the database
+        second = await self.importer.import_from_csv_content("valid csv content")
+
+        assert first["imported"] == 2
+        assert second["imported"] == 1
+        assert second["skipped"] == 1
+        assert len(self.query.upserts) == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_tools_chunks_large_batches(self):
+        """Test that large imports are split into BULK_BATCH_SIZE upserts."""
+        tools = [{"slug": f"test-{i}", "name": f"Test {i}"} for i in range(1200)]
+        self.query.respond = lambda batch: batch
+
         result = await self.importer.bulk_insert_tools(tools, replace_existing=False)
-        
-        assert result["imported"] == 0
-        assert result["skipped"] == 2
-        assert result["errors"] == 0
-        
-        # Verify no insert was attempted
-        self.importer.client.table.return_value.insert.assert_not_called()
+
+        assert sorted(len(batch) for batch, _ in self.query.upserts) == [200, 500, 500]
+        assert result == {"imported": 1200, "skipped": 0, "errors": 0}
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_tools_counts_failed_batch_as_errors(self):
+        """Test that one failed sub-batch does not discard the others."""
+        self.importer.BULK_BATCH_SIZE = 2
+        tools = [{"slug": f"test-{i}", "name": f"Test {i}"} for i in range(5)]
+
+        def respond(batch):
+            if batch[0]["slug"] == "test-2":
+                raise Exception("DB Error")
+            return batch
+
+        self.query.respond = respond
+
+        result = await self.importer.bulk_insert_tools(tools, replace_existing=True)
+
+        assert result == {"imported": 3, "skipped": 0, "errors": 2}
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_tools_bounds_concurrent_batches(self):
+        """Test that sub-batches are uploaded concurrently up to the semaphore limit."""
+        self.importer.BULK_BATCH_SIZE = 1
+        self.importer.MAX_CONCURRENT_BATCHES = 2
+        tools = [{"slug": f"test-{i}", "name": f"Test {i}"} for i in range(6)]
+
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def slow_respond(batch):
+            with lock:
+                in_flight.append(batch)
+                peak.append(len(in_flight))
+            time.sleep(0.02)
+            with lock:
+                in_flight.remove(batch)
+            return batch
+
+        self.query.respond = slow_respond
+
+        result = await self.importer.bulk_insert_tools(tools, replace_existing=False)
+
+        assert result == {"imported": 6, "skipped": 0, "errors": 0}
+        assert max(peak) == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_tools_serializes_parsed_tools(self):
+        """Test that ParsedTool records are sent to the database as dicts."""
+        tool = ParsedTool(
+            name="Test 1",
+            slug="test-1",
+            description=None,
+            website_url=None,
+            logo_url=None,
+            pricing_type="free",
+            price_range=None,
+            has_free_trial=False,
+            tags=["test"],
+            features=None,
+            quality_score=5,
+            popularity_score=0,
+            is_featured=False,
+            source="test.com",
+        )
+        self.query.data = [{"slug": "test-1"}]
+
+        result = await self.importer.bulk_insert_tools([tool], replace_existing=True)
+
+        assert result["imported"] == 1
+        assert self.query.upserts == [
+            ([asdict(tool)], {"on_conflict": "slug", "ignore_duplicates": False})
+        ]
 
     @pytest.mark.asyncio
     async def test_bulk_insert_tools_database_error(self):
@@ -254,7 +575,10 @@ class TestBaseCSVImporter:
         tools = [{"slug": "test-1", "name": "Test 1"}]
         
         # Mock database error
-        self.importer.client.table.return_value.upsert.return_value.execute.side_effect = Exception("DB Error")
+        def respond(batch):
+            raise Exception("DB Error")
+
+        self.query.respond = respond
         
         result = await self.importer.bulk_insert_tools(tools, replace_existing=True)
         
@@ -268,9 +592,7 @@ class TestBaseCSVImporter:
         tools = [{"slug": "test-1", "name": "Test 1"}]
         
         # Mock response with no data
-        mock_response = Mock()
-        mock_response.data = None
-        self.importer.client.table.return_value.upsert.return_value.execute.return_value = mock_response
+        self.query.data = None
         
         result = await self.importer.bulk_insert_tools(tools, replace_existing=True)
         
@@ -1,7 +1,10 @@
 """Unit tests for base CSV parser."""
 
 import pytest
-from app.services.base_csv_parser import BaseCSVParser
+from dataclasses import asdict
+from app.services.base_csv_parser import BaseCSVParser, ParsedTool
+
+_REQUIRED_TOOL_FIELDS = BaseCSVParser.REQUIRED_OUTPUT_FIELDS
 
 
 class MockCSVParser(BaseCSVParser):
@@ -16,29 +19,27 @@ class MockCSVParser(BaseCSVParser):
         return ["name", "description", "url"]
     
     def validate_csv_format(self, csv_content):
-        if "invalid" in csv_content:
+        if csv_content.startswith("invalid"):
             raise ValueError("Invalid format")
         return True
     
     def parse_csv_content(self, csv_content):
-        return [
-            {
-                "name": "Test Tool",
-                "slug": "test-tool",
-                "description": "A test tool",
-                "website_url": "https://test.com",
-                "logo_url": None,
-                "pricing_type": "free",
-                "price_range": None,
-                "has_free_trial": False,
-                "tags": ["test"],
-                "features": None,
-                "quality_score": 5,
-                "popularity_score": 10,
-                "is_featured": False,
-                "source": "mock.com"
-            }
-        ]
+        yield ParsedTool(
+            name="Test Tool",
+            slug="test-tool",
+            description="A test tool",
+            website_url="https://test.com",
+            logo_url=None,
+            pricing_type="free",
+            price_range=None,
+            has_free_trial=False,
+            tags=["test"],
+            features=None,
+            quality_score=5,
+            popularity_score=10,
+            is_featured=False,
+            source="mock.com",
+        )
 
 
 class TestBaseCSVParser:
@@ -63,9 +64,9 @@ class TestBaseCSVParser:
         with pytest.raises(ValueError):
             parser.validate_csv_format("invalid content")
         
-        tools = parser.parse_csv_content("test content")
+        tools = list(parser.parse_csv_content("test content"))
         assert len(tools) == 1
-        assert tools[0]["name"] == "Test Tool"
+        assert tools[0].name == "Test Tool"
 
     def test_get_sample_csv_format_default(self):
         """Test default sample CSV format method."""
@@ -78,35 +79,37 @@ class TestBaseCSVParser:
     def test_standard_tool_format_validation(self):
         """Test that parsed tools conform to expected standard format."""
         parser = MockCSVParser()
-        tools = parser.parse_csv_content("test")
+        tools = list(parser.parse_csv_content("test"))
         
         assert len(tools) == 1
         tool = tools[0]
         
-        # Verify all required fields are present
-        required_fields = [
-            "name", "slug", "description", "website_url", "logo_url",
-            "pricing_type", "price_range", "has_free_trial", "tags",
-            "features", "quality_score", "popularity_score", "is_featured", "source"
-        ]
-        
-        for field in required_fields:
-            assert field in tool, f"Missing required field: {field}"
+        # Verify all required fields are present once serialized
+        missing = _REQUIRED_TOOL_FIELDS - asdict(tool).keys()
+        assert not missing, f"Missing required fields: {sorted(missing)}"
         
         # Verify field types
-        assert isinstance(tool["name"], str)
-        assert isinstance(tool["slug"], str)
-        assert isinstance(tool["description"], str)
-        assert isinstance(tool["quality_score"], int)
-        assert isinstance(tool["popularity_score"], int)
-        assert isinstance(tool["is_featured"], bool)
-        assert isinstance(tool["has_free_trial"], bool)
-        assert isinstance(tool["source"], str)
+        assert isinstance(tool.name, str)
+        assert isinstance(tool.slug, str)
+        assert isinstance(tool.description, str)
+        assert isinstance(tool.quality_score, int)
+        assert isinstance(tool.popularity_score, int)
+        assert isinstance(tool.is_featured, bool)
+        assert isinstance(tool.has_free_trial, bool)
+        assert isinstance(tool.source, str)
         
         # Verify field constraints
-        assert 1 <= tool["quality_score"] <= 10
-        assert tool["popularity_score"] >= 0
-        assert tool["pricing_type"] in ["free", "paid", "freemium", "one-time", "no-pricing"]
+        assert 1 <= tool.quality_score <= 10
+        assert tool.popularity_score >= 0
+        assert tool.pricing_type in ["free", "paid", "freemium", "one-time", "no-pricing"]
+
+    def test_required_output_fields(self):
+        """Test that required output fields match the standard tool format."""
+        assert _REQUIRED_TOOL_FIELDS == {
+            "name", "slug", "description", "website_url", "logo_url",
+            "pricing_type", "price_range", "has_free_trial", "tags",
+            "features", "quality_score", "popularity_score", "is_featured", "source"
+        }
 
     def test_expected_columns_property(self):
         """Test that expected_columns property returns list of strings."""
@@ -24,11 +24,16 @@ class TestCSVImporterFactory:
         """Set up test fixtures."""
         # Store original importers to restore later
         self.original_importers = CSVImporterFactory._importers.copy()
+        self.original_supported_sources = CSVImporterFactory._supported_sources
+        self.original_available_sources = CSVImporterFactory._available_sources
 
     def teardown_method(self):
         """Clean up after tests."""
-        # Restore original importers
+        # Restore original importers and drop cached instances
         CSVImporterFactory._importers = self.original_importers
+        CSVImporterFactory._supported_sources = self.original_supported_sources
+        CSVImporterFactory._available_sources = self.original_available_sources
+        CSVImporterFactory._instances.clear()
 
     def test_get_importer_taaft_source(self):
         """Test getting TAAFT importer with different source names."""
@@ -128,6 +133,15 @@ class TestCSVImporterFactory:
         assert CSVImporterFactory.is_source_supported("") is False
         assert CSVImporterFactory.is_source_supported("producthunt") is False
 
+    def test_supported_sources_match_registered_keys(self):
+        """Test that the precomputed key set tracks the registry."""
+        assert CSVImporterFactory._supported_sources == frozenset(CSVImporterFactory._importers)
+        
+        CSVImporterFactory.register_importer("  Mixed_Case  ", MockCSVImporter)
+        
+        assert "mixed_case" in CSVImporterFactory._supported_sources
+        assert CSVImporterFactory._supported_sources == frozenset(CSVImporterFactory._importers)
+
     def test_is_source_supported_after_registration(self):
         """Test source support checking after new registration."""
         assert CSVImporterFactory.is_source_supported("new_test") is False
@@ -180,11 +194,23 @@ class TestCSVImporterFactory:
             assert "taaft" in error_msg
             assert "theresanaiforthat" in error_msg
 
-    def test_importer_instances_are_fresh(self):
-        """Test that each call to get_importer returns a new instance."""
+    def test_error_messages_include_registered_sources(self):
+        """Test that sources registered later are listed in error messages."""
+        CSVImporterFactory.register_importer("mock", MockCSVImporter)
+
+        with pytest.raises(ValueError, match="Available sources: .*mock"):
+            CSVImporterFactory.get_importer("invalid_source")
+
+    def test_importer_instances_are_cached(self):
+        """Test that repeated calls to get_importer reuse the same instance."""
         importer1 = CSVImporterFactory.get_importer("taaft")
         importer2 = CSVImporterFactory.get_importer("taaft")
         
-        # Should be same type but different instances
-        assert type(importer1) is type(importer2)
-        assert importer1 is not importer2
\ No newline at end of file
+        assert importer1 is importer2
+
+    def test_importer_instances_shared_across_aliases(self):
+        """Test that aliases of the same importer class share one instance."""
+        importer1 = CSVImporterFactory.get_importer("taaft")
+        importer2 = CSVImporterFactory.get_importer("theresanaiforthat.com")
+        
+        assert importer1 is importer2
\ No newline at end of file
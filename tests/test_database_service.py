@@ -0,0 +1,159 @@
+"""Unit tests for database service."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from app.database.connection import db_connection
+from app.database.service import DatabaseService
+from app.models import Tool, ToolCreate
+
+
+def make_tool(slug, website_url=None):
+    """Build a minimal ToolCreate for service tests, skipping pydantic validation."""
+    return ToolCreate.model_construct(name=slug.title(), slug=slug, website_url=website_url)
+
+
+def make_tool_row(tool_id, popularity_score=0):
+    """Build a tools table row as returned by Supabase."""
+    return {
+        "id": tool_id,
+        "name": f"Tool {tool_id}",
+        "slug": f"tool-{tool_id}",
+        "popularity_score": popularity_score,
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:00:00",
+    }
+
+
+# Tool payloads shared by the tests, built once per module without validation
+_BATCH_TOOLS = tuple(make_tool(f"tool-{i}") for i in range(5))
+_RETRY_TOOLS = (make_tool("good"), make_tool("bad"))
+
+# Table rows for the search tests; the service only reads them
+_SEARCH_ROWS = (make_tool_row(1, 5), make_tool_row(2, 50), make_tool_row(3, 20))
+
+
+@pytest.fixture
+def supabase_client():
+    """Fresh Supabase client mock; chains are created lazily as tests wire them."""
+    return Mock()
+
+
+@pytest.fixture(autouse=True)
+def patched_client(monkeypatch, supabase_client):
+    """Route the service's database connection to the client mock."""
+    monkeypatch.setattr(db_connection, "get_client", lambda: supabase_client)
+    return supabase_client
+
+
+class TestDatabaseService:
+    """Test suite for database service."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.service = DatabaseService()
+
+    @pytest.mark.parametrize(
+        "execute_result, expected_id",
+        [
+            (SimpleNamespace(data=[make_tool_row(1)]), 1),
+            (SimpleNamespace(data=[]), None),
+            (Exception("DB Error"), None),
+        ],
+        ids=["success", "no-rows", "error"],
+    )
+    def test_insert_tool(self, supabase_client, execute_result, expected_id):
+        """Test that insert_tool returns the inserted Tool, or None on no rows or errors."""
+        execute = supabase_client.table.return_value.insert.return_value.execute
+        execute.side_effect = [execute_result]
+
+        tool = self.service.insert_tool(make_tool("tool-1"))
+
+        assert (tool.id if tool else None) == expected_id
+        supabase_client.table.assert_called_once_with("tools")
+
+    @pytest.mark.parametrize(
+        "kwargs, name_rows, eq_rows, expected",
+        [
+            ({"name": "ChatGPT"}, [{"id": 1}], [], True),
+            ({"website_url": "https://openai.com"}, [], [{"id": 1}], True),
+            ({"name": "New Tool"}, [], [], False),
+            ({"name": "ChatGPT", "slug": "chatgpt"}, [], [{"id": 1}], True),
+            ({}, [{"id": 1}], [{"id": 1}], False),
+        ],
+        ids=["by-name", "by-url", "no-duplicate", "multiple-conditions", "no-filters"],
+    )
+    def test_check_duplicate_tool(self, supabase_client, kwargs, name_rows, eq_rows, expected):
+        """Test duplicate detection by name, website URL and slug."""
+        select = supabase_client.table.return_value.select.return_value
+        select.ilike.return_value.execute.return_value = SimpleNamespace(data=name_rows)
+        select.eq.return_value.execute.return_value = SimpleNamespace(data=eq_rows)
+
+        assert self.service.check_duplicate_tool(**kwargs) is expected
+
+    def test_get_all_tags_sorted_and_unique(self, supabase_client):
+        """Test that tags from all tools are deduplicated and sorted."""
+        select = supabase_client.table.return_value.select.return_value
+        select.execute.return_value = SimpleNamespace(
+            data=[{"tags": ["writing", "ai"]}, {"tags": None}, {"tags": ["ai", "coding"]}]
+        )
+
+        assert self.service.get_all_tags() == ["ai", "coding", "writing"]
+
+    def test_search_tools_deduplicates_and_sorts(self, supabase_client):
+        """Test that name and description matches are merged into Tool models."""
+        query = supabase_client.table.return_value.select.return_value.filter.return_value
+        query = query.order.return_value.order.return_value.limit.return_value.offset.return_value
+        query.execute.side_effect = [
+            SimpleNamespace(data=_SEARCH_ROWS[:2]),  # name matches: tools 1 and 2
+            SimpleNamespace(data=_SEARCH_ROWS[1:]),  # description matches: tools 2 and 3
+        ]
+
+        tools = self.service.search_tools("tool")
+
+        assert all(isinstance(tool, Tool) for tool in tools)
+        assert [tool.id for tool in tools] == [2, 3, 1]
+
+    def test_bulk_insert_tools_batches_upserts(self, supabase_client):
+        """Test that tools are streamed into one upsert per batch."""
+        upsert = supabase_client.table.return_value.upsert
+        upsert.return_value.execute.side_effect = lambda: SimpleNamespace(
+            data=upsert.call_args.args[0]
+        )
+
+        inserted = self.service.bulk_insert_tools(iter(_BATCH_TOOLS), batch_size=2)
+
+        assert inserted == 5
+        assert [len(call.args[0]) for call in upsert.call_args_list] == [2, 2, 1]
+        assert upsert.call_args_list[0].kwargs == {"on_conflict": "slug"}
+
+    def test_bulk_insert_tools_retries_failed_batch_per_tool(self, supabase_client):
+        """Test that a failed batch is retried tool by tool."""
+        execute = supabase_client.table.return_value.upsert.return_value.execute
+        execute.side_effect = [
+            Exception("batch rejected"),
+            SimpleNamespace(data=[{"slug": "good"}]),
+            Exception("bad row"),
+        ]
+
+        inserted = self.service.bulk_insert_tools(list(_RETRY_TOOLS))
+
+        assert inserted == 1
+        assert execute.call_count == 3
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("Test Category Name!", "test-category-name"),
+            ("Special/Characters & Spaces", "special-characters-spaces"),
+            ("A" * 300, "a" * 200),
+            ("", ""),
+            ("Test@#$%^&*()Tool!", "test-tool"),
+        ],
+        ids=["punctuation", "separators", "truncated", "empty", "special-characters"],
+    )
+    def test_generate_slug(self, text, expected):
+        """Test slug generation, including the 200 character limit."""
+        assert self.service.generate_slug(text) == expected
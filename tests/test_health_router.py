@@ -1,15 +1,11 @@
 import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-client = TestClient(app)
 
 
 @pytest.mark.unit
-def test_root_endpoint():
+@pytest.mark.asyncio
+async def test_root_endpoint(client):
     """Test the root endpoint returns correct message."""
-    response = client.get("/")
+    response = await client.get("/")
     assert response.status_code == 200
     assert response.json() == {
         "message": "ToolM8 Data Management API - AI Tools Scraping Service"
@@ -17,8 +13,9 @@ def test_root_endpoint():
 
 
 @pytest.mark.unit
-def test_health_check_endpoint():
+@pytest.mark.asyncio
+async def test_health_check_endpoint(client):
     """Test the health check endpoint returns correct status."""
-    response = client.get("/health")
+    response = await client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "healthy", "service": "toolm8-data-api"}
\ No newline at end of file
+    assert response.json() == {"status": "healthy", "service": "toolm8-data-api"}
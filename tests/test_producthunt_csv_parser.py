@@ -0,0 +1,167 @@
+"""Unit tests for ProductHunt CSV parser."""
+
+import pandas as pd
+import pytest
+
+from app.services.base_csv_parser import ParsedTool
+from app.services.producthunt_csv_parser import ProductHuntCSVParser
+
+SAMPLE_CSV = '''name,tagline,description,website,maker,launch_date,upvotes,comments_count,pricing,category
+ChatGPT,AI Assistant,Revolutionary AI chatbot for everyone,https://openai.com/chatgpt,Open AI,2022-11-30,1500,250,Free and paid plans,AI Tools
+Notion AI,Write faster,,https://notion.so,,2023-02-22,300,60,Paid subscription,Productivity
+,Missing name,,,,,,,,
+Tiny,Short tagline,short,,,,abc,,Free,'''
+
+
+class TestProductHuntCSVParser:
+    """Test suite for ProductHunt CSV parser."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = ProductHuntCSVParser()
+
+    def test_source_name(self):
+        """Test source name property."""
+        assert self.parser.source_name == "producthunt.com"
+
+    def test_validate_csv_format_valid(self):
+        """Test CSV format validation with valid data."""
+        assert self.parser.validate_csv_format(SAMPLE_CSV) is True
+
+    def test_validate_csv_format_missing_required_column(self):
+        """Test CSV format validation with missing required column."""
+        with pytest.raises(ValueError, match="Missing required ProductHunt columns"):
+            self.parser.validate_csv_format("name,website\nChatGPT,https://openai.com")
+
+    def test_validate_csv_format_lists_missing_columns(self):
+        """Test that every missing required column is reported."""
+        with pytest.raises(ValueError, match=r"\['name', 'tagline'\]"):
+            self.parser.validate_csv_format("website,maker\nhttps://openai.com,OpenAI")
+
+    def test_parse_csv_content_skips_rows_without_name(self):
+        """Test that rows without a name are dropped."""
+        tools = self.parser.parse_csv_content(SAMPLE_CSV)
+
+        assert [tool.name for tool in tools] == ["ChatGPT", "Notion AI", "Tiny"]
+        assert all(isinstance(tool, ParsedTool) for tool in tools)
+
+    def test_parse_csv_content_transforms_fields(self):
+        """Test the standard-format fields produced for each row."""
+        chatgpt, notion, tiny = self.parser.parse_csv_content(SAMPLE_CSV)
+
+        assert chatgpt.slug == "chatgpt"
+        assert chatgpt.description == "Revolutionary AI chatbot for everyone"
+        assert chatgpt.website_url == "https://openai.com/chatgpt"
+        assert chatgpt.pricing_type == "freemium"
+        assert chatgpt.has_free_trial is False
+        assert chatgpt.tags == ["ai tools", "by-open-ai"]
+        assert chatgpt.features == ["highly-popular", "well-discussed"]
+        assert chatgpt.quality_score == 9
+        assert chatgpt.popularity_score == 200
+        assert chatgpt.source == "producthunt.com"
+
+        assert notion.description == "Write faster"
+        assert notion.pricing_type == "paid"
+        assert notion.price_range == "Paid subscription"
+        assert notion.tags == ["productivity"]
+        assert notion.features == ["popular", "well-discussed"]
+        assert notion.quality_score == 6
+        assert notion.popularity_score == 42
+
+        assert tiny.description == "Short tagline"
+        assert tiny.pricing_type == "free"
+        assert tiny.website_url is None
+        assert tiny.tags is None
+        assert tiny.features is None
+        assert tiny.quality_score == 5
+        assert tiny.popularity_score == 0
+
+    def test_generate_slugs(self):
+        """Test column-wise slug generation."""
+        names = ["ChatGPT", "GPT-4 Turbo", "  Test!@#  Tool  ", "A -- B", "Ünïcode App"]
+
+        slugs = self.parser._generate_slugs(pd.Series(names, dtype="string"))
+
+        assert list(slugs) == ["chatgpt", "gpt-4-turbo", "test-tool", "a-b", "ncode-app"]
+
+    def test_parse_csv_content_without_website_column(self):
+        """Test parsing when the optional website column is absent."""
+        tools = self.parser.parse_csv_content("name,tagline\n  Padded Name  ,Tagline here")
+
+        assert len(tools) == 1
+        assert tools[0].name == "Padded Name"
+        assert tools[0].slug == "padded-name"
+        assert tools[0].website_url is None
+
+    def test_pricing_columns(self):
+        """Test pricing type, price range and free trial columns."""
+        values = ["Free", "Freemium", "Free and paid plans", "  $10 monthly ", "Lifetime deal",
+                  "Free trial", "One-time $5", "Unknown", None]
+        df = pd.DataFrame({"pricing": values})
+
+        columns = self.parser._pricing_columns(df)
+
+        assert list(columns["_pricing_type"]) == [
+            "free", "free", "freemium", "paid", "one-time", "free", "paid", "no-pricing",
+            "no-pricing",
+        ]
+        assert list(columns["_price_range"]) == [
+            "Free", "Freemium", "Free and paid plans", "$10 monthly", "Lifetime deal",
+            "Free trial", "One-time $5", "Unknown", None,
+        ]
+        assert list(columns["_has_free_trial"]) == [
+            False, True, False, False, False, True, False, False, False,
+        ]
+
+    def test_pricing_columns_without_pricing_column(self):
+        """Test the pricing defaults when the optional pricing column is absent."""
+        columns = self.parser._pricing_columns(pd.DataFrame({"name": ["Tool"]}))
+
+        assert columns == {
+            "_pricing_type": "no-pricing", "_price_range": None, "_has_free_trial": False
+        }
+
+    def test_score_columns(self):
+        """Test quality and popularity score thresholds, treating bad counts as 0."""
+        df = pd.DataFrame(
+            {
+                "upvotes": [0, 101, 501, 1001, 2500, None, "abc", 50],
+                "comments_count": [0, 51, 101, 10, 200, 60, None, "n/a"],
+            }
+        )
+
+        columns = self.parser._score_columns(df)
+
+        assert list(columns["_quality_score"]) == [5, 6, 8, 8, 9, 6, 5, 5]
+        assert list(columns["_popularity_score"]) == [0, 20, 70, 102, 290, 12, 0, 5]
+
+    def test_validate_csv_format_reads_header_only(self):
+        """Test that validation only needs the header row."""
+        assert self.parser.validate_csv_format(' name , tagline \n"unterminated') is True
+
+        with pytest.raises(ValueError, match="CSV content is empty"):
+            self.parser.validate_csv_format("")
+
+    def test_text_columns(self):
+        """Test column-wise descriptions and tags, including blank and missing cells."""
+        df = pd.DataFrame(
+            {
+                "description": ["A long enough description", "short", None, "   ", None],
+                "tagline": ["Tagline", "Short tagline", "Only tagline", None, None],
+                "category": ["AI Tools", None, " Productivity ", "", None],
+                "maker": ["Open AI", "Solo", None, "  Jane Doe ", None],
+            }
+        )
+
+        columns = self.parser._text_columns(df)
+
+        assert list(columns["_description"]) == [
+            "A long enough description",
+            "Short tagline",
+            "Only tagline",
+            "ProductHunt tool: No description available",
+            "ProductHunt tool: No description available",
+        ]
+        assert list(columns["_tags"]) == [
+            ["ai tools", "by-open-ai"], ["by-solo"], ["productivity"], ["by-jane-doe"], None
+        ]
@@ -1,9 +1,11 @@
 """Unit tests for TAAFT CSV parser."""
 
 import pytest
+from io import StringIO
 from unittest.mock import patch
 import pandas as pd
 
+from app.services.base_csv_parser import ParsedTool
 from app.services.csv_parser import TAaftCSVParser
 
 
@@ -70,20 +72,20 @@ Writing,https://openai.com/chatgpt'''
 https://example.com/icon.svg,ChatGPT,https://openai.com/chatgpt,Writing,Free + from $20/mo,1500,25,4.5,Great AI tool
 https://example.com/icon2.svg,Midjourney,https://midjourney.com,Image Generation,From $10/mo,2500,40,4.8,Amazing image generator'''
         
-        tools = self.parser.parse_csv_content(csv_content)
+        tools = list(self.parser.parse_csv_content(csv_content))
         
         assert len(tools) == 2
         
         # Test first tool
         tool1 = tools[0]
-        assert tool1["name"] == "ChatGPT"
-        assert tool1["slug"] == "chatgpt"
-        assert tool1["source"] == "theresanaiforthat.com"
-        assert tool1["pricing_type"] == "freemium"
-        assert tool1["quality_score"] >= 1
-        assert tool1["popularity_score"] >= 0
-        assert isinstance(tool1["tags"], list) or tool1["tags"] is None
-        assert isinstance(tool1["features"], list) or tool1["features"] is None
+        assert tool1.name == "ChatGPT"
+        assert tool1.slug == "chatgpt"
+        assert tool1.source == "theresanaiforthat.com"
+        assert tool1.pricing_type == "freemium"
+        assert tool1.quality_score >= 1
+        assert tool1.popularity_score >= 0
+        assert isinstance(tool1.tags, list) or tool1.tags is None
+        assert isinstance(tool1.features, list) or tool1.features is None
 
     def test_parse_csv_content_empty_data(self):
         """Test parsing CSV with no valid tools."""
@@ -91,9 +93,44 @@ https://example.com/icon2.svg,Midjourney,https://midjourney.com,Image Generation
 ,
 ,Writing'''
         
-        tools = self.parser.parse_csv_content(csv_content)
+        tools = list(self.parser.parse_csv_content(csv_content))
         assert len(tools) == 0
 
+    def test_parse_csv_content_short_rows_and_padded_headers(self):
+        """Test parsing rows with missing trailing fields and padded headers."""
+        csv_content = ''' ai_link , task_label ,saves,stats_views
+ChatGPT,Writing,25,"1,500"
+Midjourney'''
+
+        tools = list(self.parser.parse_csv_content(csv_content))
+
+        assert [tool.name for tool in tools] == ["ChatGPT", "Midjourney"]
+        assert tools[0].tags == ["writing"]
+        assert tools[0].popularity_score == 51
+        assert tools[1].popularity_score == 0
+
+    def test_parse_csv_content_yields_lazily(self):
+        """Test that tools are yielded before the rest of the CSV is parsed."""
+        tools = self.parser.parse_csv_content("ai_link\nChatGPT\nMidjourney")
+
+        assert next(tools).name == "ChatGPT"
+        assert [tool.name for tool in tools] == ["Midjourney"]
+
+    def test_parse_csv_content_from_text_stream(self):
+        """Test validating and parsing a text stream instead of a string."""
+        stream = StringIO("ai_link,task_label\nChatGPT,Writing\n")
+
+        assert self.parser.validate_csv_format(stream) is True
+        stream.seek(0)
+        assert [tool.name for tool in self.parser.parse_csv_content(stream)] == ["ChatGPT"]
+
+    def test_iter_csv_rows_strips_column_names(self):
+        """Test that rows are yielded lazily with stripped column names."""
+        rows = self.parser.iter_csv_rows(" ai_link ,task_label\nChatGPT,Writing")
+
+        assert next(rows) == {"ai_link": "ChatGPT", "task_label": "Writing"}
+        assert next(rows, None) is None
+
     def test_clean_string_valid(self):
         """Test string cleaning with valid input."""
         assert self.parser.clean_string("  test  ") == "test"
@@ -113,6 +150,23 @@ https://example.com/icon2.svg,Midjourney,https://midjourney.com,Image Generation
         assert self.parser.generate_slug("Test!@# Tool") == "test-tool"
         assert self.parser.generate_slug("  Multiple   Spaces  ") == "multiple-spaces"
 
+    def test_generate_slug_batch(self):
+        """Test slugs for separator runs and special characters across many names."""
+        cases = {
+            "AI & Machine Learning": "ai-machine-learning",
+            "a - b": "a-b",
+            "a -- b\t-\nc": "a-b-c",
+            "--Leading and trailing--": "leading-and-trailing",
+            "snake_case_name": "snakecasename",
+            "Ünïcode App": "ncode-app",
+            "!!!": "",
+        }
+        names = list(cases) * 1000
+
+        slugs = [self.parser.generate_slug(name) for name in names]
+
+        assert slugs == [cases[name] for name in names]
+
     def test_clean_url_valid(self):
         """Test URL cleaning with valid URLs."""
         url = "https://example.com/tool?utm_source=test&ref=taaft"
@@ -136,6 +190,12 @@ https://example.com/icon2.svg,Midjourney,https://midjourney.com,Image Generation
         assert self.parser.extract_pricing_type(None) == "no-pricing"
         assert self.parser.extract_pricing_type("") == "no-pricing"
 
+    def test_extract_pricing_type_precedence(self):
+        """Test that the strongest pricing marker wins regardless of position."""
+        assert self.parser.extract_pricing_type("From $5/mo, free trial") == "freemium"
+        assert self.parser.extract_pricing_type("Buy once or $3/mo") == "paid"
+        assert self.parser.extract_pricing_type("FREE") == "free"
+
     def test_extract_price_range(self):
         """Test price range extraction."""
         assert self.parser.extract_price_range("Free + from $20/mo") == "$20/month"
@@ -191,6 +251,14 @@ https://example.com/icon2.svg,Midjourney,https://midjourney.com,Image Generation
         assert 1 <= score <= 10
         assert score == 5  # Base score
 
+    def test_calculate_scores_non_numeric_values(self):
+        """Test that non-numeric metrics fall back to neutral values."""
+        row = {"average_rating": "n/a", "saves": "", "stats_views": None}
+
+        assert self.parser.calculate_quality_score(row) == 5
+        assert self.parser.calculate_popularity_score(row) == 0
+        assert self.parser.extract_features(row) is None
+
     def test_calculate_popularity_score(self):
         """Test popularity score calculation."""
         row = pd.Series({
@@ -218,15 +286,49 @@ https://example.com/icon2.svg,Midjourney,https://midjourney.com,Image Generation
         
         tool = self.parser.transform_row(row)
         
-        assert tool is not None
-        assert tool["name"] == "ChatGPT"
-        assert tool["slug"] == "chatgpt"
-        assert tool["source"] == "theresanaiforthat.com"
-        assert "website_url" in tool
-        assert "logo_url" in tool
-        assert "pricing_type" in tool
-        assert "quality_score" in tool
-        assert "popularity_score" in tool
+        assert isinstance(tool, ParsedTool)
+        assert tool.name == "ChatGPT"
+        assert tool.slug == "chatgpt"
+        assert tool.source == "theresanaiforthat.com"
+        assert tool.website_url == "https://openai.com/chatgpt"
+        assert tool.logo_url == "https://example.com/icon.svg"
+        assert tool.pricing_type == "freemium"
+        assert 1 <= tool.quality_score <= 10
+        assert tool.popularity_score >= 0
+
+    @pytest.mark.parametrize(
+        "external_link, visit_link, expected",
+        [
+            ("https://openai.com/chat", "https://example.com/visit", "https://openai.com/chat"),
+            ("", "https://example.com/visit", "https://example.com/visit"),
+            ("", "", None),
+        ],
+        ids=["external-link", "visit-link-fallback", "no-link"],
+    )
+    def test_parse_csv_content_website_url_fallback(self, external_link, visit_link, expected):
+        """Test that an empty external link falls back to the visit-website link."""
+        csv_content = (
+            "ai_link,external_ai_link href,visit_ai_website_link href\n"
+            f"ChatGPT,{external_link},{visit_link}\n"
+        )
+
+        [tool] = self.parser.parse_csv_content(csv_content)
+
+        assert tool.website_url == expected
+
+    def test_transform_row_tags_and_features_match_extractors(self):
+        """Test that inlined tag/feature building matches the extractor helpers."""
+        row = {
+            "ai_link": "Free Tool",
+            "task_label": "Coding",
+            "ai_launch_date": "100% free",
+            "average_rating": "4.9",
+        }
+
+        tool = self.parser.transform_row(row)
+
+        assert tool.tags == self.parser.extract_tags(row) == ["coding", "free"]
+        assert tool.features == self.parser.extract_features(row) == ["highly-rated"]
 
     def test_transform_row_missing_name(self):
         """Test row transformation with missing name."""
@@ -246,12 +348,12 @@ Valid Tool,Writing
 ,Invalid Row
 Another Tool,Image Generation'''
         
-        tools = self.parser.parse_csv_content(csv_content)
+        tools = list(self.parser.parse_csv_content(csv_content))
         
         # Should get 2 valid tools, 1 invalid row skipped
         assert len(tools) == 2
-        assert tools[0]["name"] == "Valid Tool"
-        assert tools[1]["name"] == "Another Tool"
+        assert tools[0].name == "Valid Tool"
+        assert tools[1].name == "Another Tool"
 
     def test_extract_description(self):
         """Test description extraction."""